@@ -1,106 +1,201 @@
-import time
+import sys
+import threading
+from pathlib import Path
+
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
+# dossier src/ : modules partagés entre les sous-projets (reachy_local, ...)
+SRC_DIR = Path(__file__).resolve().parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
 
-from prompts.prompt_emotion_PAD import get_emotion_PAD
-from prompts.prompt_duration import get_duration
+from reachy_local import connect
 
+from cli import load_config, parse_pad_line
+from prompts.prompt_emotion_PAD import emotion_registry
 from timestep import timestep
-
-from antennas_params.ant_main import main as antennas_main
-from antennas_params.ant_angles import ant_angles
-from antennas_params.ant_center import ant_center
-
-from head_params.head_s_center import head_s_center
-from head_params.head_amplitude import head_amplitude
-from head_params.head_frequency import head_frequency
-from head_params.head_amp_max import amp_max_yes
-
-# --- SELECTION DES PARAMETRES EMOTIONNELS ET DUREE ---
-pleasure, arousal, dominance = get_emotion_PAD()
-duration = get_duration()
-
-# --- TEST ANTENNES ISOLEES
-# antennas_main(
-#     pleasure=pleasure, 
-#     arousal=arousal, 
-#     dominance=dominance, 
-#     duration=duration
-# )
-
-# --- CHOIX DU MOUVEMENT (YES / NO / ...) ---
-# yes==True # choix du mouvement YES / NO
-
-# --- CENTRES DU MOUVEMENT ---
-x_center, z_center, pitch_center, yaw_center, z_norm = head_s_center(pleasure, arousal, dominance)
-base_antennas = ant_center(pleasure)
-
-amp_max = amp_max_yes(
-    arousal=arousal,
-    z_norm=z_norm
-)
-# print(f"Amplitude max YES selon arousal et z_norm : {amp_max:.3f} rad et en degrees : {np.degrees(amp_max):.1f}°")
-dt = timestep(pleasure, arousal)
-
-def main():
-
-    with ReachyMini(media_backend="no_media") as mini:
-        pose_center = create_head_pose(
-            x=x_center,
-            z=z_center,
-            pitch=pitch_center,
-            yaw=yaw_center
-        )
+from scheduler import FixedRateScheduler
+from instrumentation import make_profiler
+from trajectory_cache import TrajectoryCache
+from blending import MotionBlender
+from command_filter import CommandFilter
+
+
+def main(argv: list[str] | None = None):
+    """
+    Joue un mouvement émotionnel.
+    PAD, durée et type de mouvement viennent des arguments ou d'un fichier
+    de configuration (cf. cli.load_config) ; rien n'est calculé à l'import.
+    """
+    # --- SELECTION DES PARAMETRES EMOTIONNELS, DUREE ET MOUVEMENT ---
+    config = load_config(argv)
+    pleasure, arousal, dominance = config["pleasure"], config["arousal"], config["dominance"]
+    duration = config["duration"]
+
+    if config["live"]:
+        run_live(config)
+        return
+
+    # --- TEST ANTENNES ISOLEES
+    # from antennas_params.ant_main import main as antennas_main
+    # antennas_main(
+    #     pleasure=pleasure, 
+    #     arousal=arousal, 
+    #     dominance=dominance, 
+    #     duration=duration
+    # )
+
+    # --- TRAJECTOIRE PRÉCALCULÉE ---
+    # Toute la trajectoire (tête + antennes) est calculée une seule fois avant la boucle,
+    # la boucle de contrôle ne fait plus que lire les échantillons.
+    # Les trajectoires déjà rendues sont relues depuis le cache disque (mmap).
+    dt = timestep(pleasure, arousal)
+    yaw_side = np.random.choice([-1.0, 1.0])
+    trajectory = TrajectoryCache().get_or_render(
+        pleasure, arousal, dominance, duration, dt,
+        motion=config["motion"],
+        yaw_side=yaw_side
+    )
+
+    # le SDK n'est chargé que quand on pilote vraiment le robot (backend "robot")
+    with connect(config["backend"], media_backend="no_media") as mini:
+        pose_center = trajectory["pose_center"]
+        base_antennas = trajectory["base_antennas"]
         sign = -1 if dominance >= 0 else 1
         mini.goto_target( 
                 head=pose_center,
                 antennas=[sign * base_antennas, -sign * base_antennas], 
                 duration=1.0)
         
+        heads = trajectory["head"]
+        antennas = trajectory["antennas"]
+        n = len(trajectory["t"])
+
+        commands = make_command_filter(mini, config)
+
+        # échéances absolues : l'échantillon i est joué à t0 + i * dt,
+        # les échantillons en retard sont sautés pour rester calé sur l'horloge
+        scheduler = FixedRateScheduler(dt, policy="skip")
+
+        # instrumentation optionnelle (--profile ou REACHY_PROFILE=1), rapport sur SIGUSR1 et en fin de course
+        profiler = make_profiler(("compute", "set_target", "sleep"), enabled=config["profile"], period=dt)
+        profiler.install_signal_handler(scheduler.stats)
+
         try:
-            t0 = time.time()
-            t = time.time() - t0
-            while True:
-                
-                # --- OSCILLATION PITCH AUTOUR DU CENTRE ---
-                amplitude = head_amplitude(t, arousal, dominance, amp_max, duration)     # radians
-                frequency = head_frequency(amplitude, pleasure, amp_max)      # Hertz
-                print(f"t={t:.2f} s - amp={amplitude:.3f} rad ({np.degrees(amplitude):.1f}°) - freq={frequency:.3f} Hz")
-
-                angle = amplitude * np.sin(2 * np.pi * frequency * t)
-                
-                # rotation relative (YES)
-                R_offset = R.from_euler("xyz", [0.0, angle, 0.0], degrees=False)
-
-                # rotation centrale extraite
-                R_center = R.from_matrix(pose_center[:3, :3])
-
-                # composition : centre + oscillation
-                R_total = R_center * R_offset
-
-                pose = pose_center.copy()
-                pose[:3, :3] = R_total.as_matrix()
-                
-                # --- MOUVEMENTS ANTENNES ---
-                antennas_angles = ant_angles(
-                    center=base_antennas,
-                    pleasure=pleasure,
-                    dominance=dominance,
-                    t=t
-                )            
-
-                mini.set_target(
-                    head=pose,
+            i = scheduler.wait()
+            while i < n:
+                profiler.begin()
+                head = heads[i]
+                antennas_angles = antennas[i]
+                profiler.mark(0)
+
+                commands.send(
+                    head=head,
                     antennas=antennas_angles
                     )
-                time.sleep(dt)
-                t += dt  # incrément strict
+                profiler.mark(1)
+
+                overruns = scheduler.overruns
+                i = scheduler.wait()
+                profiler.mark(2)
+                profiler.end(missed=scheduler.overruns != overruns)
+
+            commands.flush()
+            print(f"Fin du mouvement : {scheduler.stats()}")
+
+        except KeyboardInterrupt:
+            print("¡¡ Interruption détectée !!")
+
+        finally:
+            # rapports aussi après un Ctrl+C, comme en mode continu
+            print(f"Commandes : {commands.stats()}")
+            profiler.report(scheduler.stats())
+            if config["backend"] == "local":
+                mini.report()
+            mini.goto_target(
+                np.eye(4),
+                antennas=[0.0, 0.0], 
+                duration=0.5
+            )
+
+
+def make_command_filter(mini, config: dict) -> CommandFilter:
+    """Étage de sortie vers mini.set_target (suppression des petits écarts, débit max)."""
+    return CommandFilter(
+        mini.set_target,
+        rotation_threshold=config["min_delta"],
+        antennas_threshold=config["min_delta"],
+        translation_threshold=0.1 * config["min_delta"],
+        max_rate=config["max_rate"],
+    )
+
+
+def read_emotions(blender: MotionBlender, duration: float) -> None:
+    """Lit les nouvelles émotions sur l'entrée standard (nom ou "P A D", une par ligne)."""
+    for line in sys.stdin:
+        pad = parse_pad_line(line)
+        if pad is None:
+            print(f"Ligne ignorée : {line.strip()!r}")
+            continue
+        name, distance = emotion_registry().nearest(pad)
+        print(f"Nouvelle émotion : {pad} (proche de {name}, d={distance:.2f})")
+        blender.set_target(*pad, duration=duration)
+
+
+def run_live(config: dict) -> None:
+    """
+    Mode continu : le flux de commandes n'est jamais interrompu,
+    chaque nouvelle émotion lue sur l'entrée standard est atteinte
+    par une transition de config["blend_time"] secondes.
+    """
+    pleasure, arousal, dominance = config["pleasure"], config["arousal"], config["dominance"]
+    dt = timestep(pleasure, arousal)
+    blender = MotionBlender(
+        pleasure, arousal, dominance, config["duration"],
+        blend_time=config["blend_time"],
+        motion=config["motion"],
+        yaw_side=np.random.choice([-1.0, 1.0])
+    )
+
+    with connect(config["backend"], media_backend="no_media") as mini:
+        head, antennas_angles = blender.step(0.0)
+        mini.goto_target(head=head, antennas=antennas_angles, duration=1.0)
+
+        threading.Thread(target=read_emotions, args=(blender, config["duration"]), daemon=True).start()
+        print("Mode continu : tapez une émotion ou 'P A D' puis Entrée (Ctrl+C pour quitter).")
+
+        commands = make_command_filter(mini, config)
+        scheduler = FixedRateScheduler(dt, policy="skip")
+        profiler = make_profiler(("compute", "set_target", "sleep"), enabled=config["profile"], period=dt)
+        profiler.install_signal_handler(scheduler.stats)
+
+        try:
+            tick = scheduler.wait()
+            while True:
+                profiler.begin()
+                head, antennas_angles = blender.step(dt)
+                profiler.mark(0)
+
+                commands.send(head=head, antennas=antennas_angles)
+                profiler.mark(1)
+
+                overruns = scheduler.overruns
+                next_tick = scheduler.wait()
+                # itérations sautées par le scheduler : le mouvement reste calé sur l'horloge
+                if next_tick - tick > 1:
+                    blender.advance((next_tick - tick - 1) * dt)
+                tick = next_tick
+                profiler.mark(2)
+                profiler.end(missed=scheduler.overruns != overruns)
 
         except KeyboardInterrupt:
             print("¡¡ Interruption détectée !!")
+
+        finally:
+            print(f"Commandes : {commands.stats()}")
+            profiler.report(scheduler.stats())
+            if config["backend"] == "local":
+                mini.report()
             mini.goto_target(
                 np.eye(4),
                 antennas=[0.0, 0.0], 
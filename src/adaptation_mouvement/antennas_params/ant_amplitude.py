@@ -1,5 +1,5 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm
+from normalsiation_PAD.norm import positive_norm, positive_norm_array
 
 def ant_amplitude(dominance: float, center: float) -> float:
     """
@@ -18,4 +18,14 @@ def ant_amplitude(dominance: float, center: float) -> float:
     
     # Appliquer dominance
     A_max = A_phys_max * dominance_norm
-    return A_max
\ No newline at end of file
+    return A_max
+
+
+def ant_amplitude_batch(dominance, center):
+    """
+    Version vectorisée de ant_amplitude : dominance et center peuvent être
+    des tableaux NumPy (broadcast entre eux).
+    """
+    dominance_norm = positive_norm_array("Dominance", dominance)
+    A_phys_max = np.minimum(center, 3.16 - np.asarray(center))
+    return A_phys_max * dominance_norm
\ No newline at end of file
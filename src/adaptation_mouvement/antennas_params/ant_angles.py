@@ -1,11 +1,12 @@
 import numpy as np
-from .ant_amplitude import ant_amplitude
-from .ant_frequency import ant_frequency
+from .ant_amplitude import ant_amplitude, ant_amplitude_batch
+from .ant_frequency import ant_frequency, ant_frequency_batch
 
 def ant_angles(center: float = 0.0,
                 pleasure: float = 0.0,
                 dominance: float = 0.0,
-                t: float = 0.0) -> list[float]:
+                t: float = 0.0,
+                phase: float | None = None) -> list[float]:
     """
     Retourne les angles des antennes selon PAD à un instant t.
 
@@ -15,6 +16,8 @@ def ant_angles(center: float = 0.0,
         arousal: influence la fluidité/saccade
         dominance: influence l'amplitude
         t: temps écoulé (s)
+        phase: phase de l'oscillation (rad), intégrée par un PhaseOscillator.
+            Si None, la phase est 2π f(t) t (saute quand la fréquence varie).
 
     Returns:
         angles des antennes [right, left] en rad
@@ -24,7 +27,9 @@ def ant_angles(center: float = 0.0,
     f_t = ant_frequency(pleasure, t)
 
     # --- calcul angles ---
-    angle = A_max * np.sin(2 * np.pi * f_t * t)
+    if phase is None:
+        phase = 2 * np.pi * f_t * t
+    angle = A_max * np.sin(phase)
 
     # antennes symétriques selon dominance : 
     if dominance >= 0:
@@ -35,4 +40,24 @@ def ant_angles(center: float = 0.0,
         left_angle  = - center - angle
     # En plus de l'amplitude, la dominance a un impact sur le coté tourné vers l'extérieur/intérieur du mouvement
 
-    return [right_angle, left_angle]
\ No newline at end of file
+    return [right_angle, left_angle]
+
+
+def ant_angles_batch(center=0.0, pleasure=0.0, dominance=0.0, t=0.0, phase=None) -> np.ndarray:
+    """
+    Version vectorisée de ant_angles : tous les arguments peuvent être des
+    tableaux NumPy (broadcast entre eux).
+
+    Returns:
+        tableau (..., 2) des angles [right, left] en rad
+    """
+    A_max = ant_amplitude_batch(dominance, center)
+    if phase is None:
+        phase = 2 * np.pi * ant_frequency_batch(pleasure, t) * np.asarray(t)
+    angle = A_max * np.sin(phase)
+
+    # dominance >= 0 : right = -(center + angle), left = center + angle ; inversé sinon
+    right_angle = np.where(np.asarray(dominance) >= 0, - center - angle, center + angle)
+    left_angle = np.where(np.asarray(dominance) >= 0, center + angle, - center - angle)
+
+    return np.stack([right_angle, left_angle], axis=-1)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm
+from normalsiation_PAD.norm import positive_norm, positive_norm_array
 
 def ant_center(pleasure: float, min_angle=0.0, max_angle=3.16) -> float:
     """
@@ -12,4 +12,12 @@ def ant_center(pleasure: float, min_angle=0.0, max_angle=3.16) -> float:
     # On inverse pour que plaisir négatif → grand offset (= antennes basses)
     offset = max_angle - (pleasure_norm * (max_angle - min_angle))
     
-    return offset
\ No newline at end of file
+    return offset
+
+
+def ant_center_batch(pleasure, min_angle=0.0, max_angle=3.16):
+    """
+    Version vectorisée de ant_center : pleasure peut être un tableau NumPy.
+    """
+    pleasure_norm = positive_norm_array("Pleasure", pleasure)
+    return max_angle - (pleasure_norm * (max_angle - min_angle))
\ No newline at end of file
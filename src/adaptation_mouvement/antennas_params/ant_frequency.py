@@ -1,5 +1,5 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm
+from normalsiation_PAD.norm import positive_norm, positive_norm_array
 
 def ant_frequency(pleasure: float, t: float) -> float:
     """
@@ -24,4 +24,21 @@ def ant_frequency(pleasure: float, t: float) -> float:
 
     f_t = f_base * (1 + mod_depth * np.sin(2 * np.pi * mod_freq * t))
 
-    return f_t
\ No newline at end of file
+    return f_t
+
+
+def ant_frequency_batch(pleasure, t):
+    """
+    Version vectorisée de ant_frequency : pleasure et t peuvent être
+    des tableaux NumPy (broadcast entre eux).
+    """
+    p = positive_norm_array("Pleasure", pleasure)
+
+    f_min = 0.05
+    f_max = 0.90
+    f_base = f_min + (f_max - f_min) * p
+
+    mod_depth = 0.08 * p
+    mod_freq  = 1.2
+
+    return f_base * (1 + mod_depth * np.sin(2 * np.pi * mod_freq * np.asarray(t)))
\ No newline at end of file
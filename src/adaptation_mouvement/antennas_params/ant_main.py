@@ -1,26 +1,29 @@
 import numpy as np
-import time
 from timestep import timestep
+from scheduler import FixedRateScheduler
 
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
+from oscillator import PhaseOscillator
 from .ant_center import ant_center
 from .ant_angles import ant_angles
+from .ant_frequency import ant_frequency
 
 def main(pleasure: float = 0.0,
         arousal: float = 0.0,
         dominance: float = 0.0,
-        duration: float = 5.0) -> None:
+        duration: float = 5.0,
+        backend: str = "robot") -> None:
     """
     Fonction pour tester le mouvement des antennes isolément.
     Reste du corps en position neutre.
 
-    Args: PAD values
+    Args: PAD values, backend ("robot" ou "local", cf. reachy_local)
     """
+    from reachy_local import connect, create_head_pose
+
     dt = timestep(pleasure, arousal)
     center = ant_center(pleasure)
 
-    with ReachyMini(media_backend="no_media") as mini:
+    with connect(backend, media_backend="no_media") as mini:
 
         # Sign modifie la direction que prennent les antennes pour aller au centre
             # Dominance positive → antennes s'écartent vers l'extérieur
@@ -34,21 +37,30 @@ def main(pleasure: float = 0.0,
             body_yaw=0.0
         ) 
     
+        # t suit l'horloge réelle : les itérations en retard sont sautées
+        scheduler = FixedRateScheduler(dt, policy="skip")
+
+        # phase intégrée pas à pas : la fréquence varie avec t sans saut de phase
+        oscillator = PhaseOscillator()
+
         try:
-            t0 = time.time()
-            t = time.time() - t0
+            tick = scheduler.wait()
+            t = scheduler.t
 
             while t <= duration:
                 antennas_angles = ant_angles(
                     center=center,
                     pleasure=pleasure,
                     dominance=dominance,
-                    t=t
+                    t=t,
+                    phase=oscillator.phase
                 )
                 mini.set_target(antennas=antennas_angles)
 
-                time.sleep(dt)
-                t += dt
+                previous = tick
+                tick = scheduler.wait()
+                oscillator.skip(ant_frequency(pleasure, t), (tick - previous) * dt)
+                t = scheduler.t
 
         except KeyboardInterrupt:
             print("¡¡ Interruption détectée !!")
@@ -60,7 +72,7 @@ def main(pleasure: float = 0.0,
                 head=create_head_pose(),
                 duration=0.5
             )
-            print("Fin du mouvement des antennes.")
+            print(f"Fin du mouvement des antennes. {scheduler.stats()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,181 @@
+import threading
+
+import numpy as np
+
+from antennas_params.ant_amplitude import ant_amplitude
+from antennas_params.ant_center import ant_center
+from antennas_params.ant_frequency import ant_frequency
+
+from head_params.head_s_center import head_s_center
+from head_params.head_amplitude import head_amplitude
+from head_params.head_frequency import head_frequency
+from head_params.head_amp_max import amp_max_yes
+
+from trajectory import MOTIONS
+from pose_math import PoseComposer, euler_to_matrix
+from oscillator import PhaseOscillator
+
+# Paramètres mélangés pendant une transition
+BLENDED = ("x", "z", "pitch", "yaw", "amplitude", "frequency",
+           "ant_center", "ant_amplitude", "ant_frequency", "ant_side")
+
+
+def smoothstep(u: float) -> float:
+    """Rampe 0 → 1 à dérivées nulles aux extrémités."""
+    u = min(max(u, 0.0), 1.0)
+    return u * u * (3.0 - 2.0 * u)
+
+
+class EmotionTarget:
+    """
+    Paramètres d'un mouvement pour un état PAD donné.
+    Les centres sont calculés une seule fois ; l'amplitude et les fréquences
+    sont évaluées au temps local t (depuis l'arrivée de l'émotion).
+    """
+
+    def __init__(self, pleasure, arousal, dominance, duration, yaw_side=None):
+        self.pleasure = pleasure
+        self.arousal = arousal
+        self.dominance = dominance
+        self.duration = duration
+
+        x, z, pitch, yaw, z_norm = head_s_center(pleasure, arousal, dominance, yaw_side)
+        self.center = {"x": x, "z": z, "pitch": pitch, "yaw": yaw}
+        self.amp_max = amp_max_yes(arousal=arousal, z_norm=z_norm)
+
+        self.ant_center = ant_center(pleasure)
+        self.ant_amplitude = ant_amplitude(dominance, self.ant_center)
+        # dominance >= 0 → antennes vers l'extérieur, sinon vers l'intérieur (cf. ant_angles)
+        self.ant_side = 1.0 if dominance >= 0 else -1.0
+
+    def values(self, t: float) -> dict:
+        amplitude = head_amplitude(t, self.arousal, self.dominance, self.amp_max, self.duration)
+        # même appel que trajectory.py (amp_max à la place de l'arousal, comme à l'origine)
+        return {
+            **self.center,
+            "amplitude": amplitude,
+            "frequency": head_frequency(amplitude, self.pleasure, self.amp_max),
+            "ant_center": self.ant_center,
+            "ant_amplitude": self.ant_amplitude,
+            "ant_frequency": ant_frequency(self.pleasure, t),
+            "ant_side": self.ant_side,
+        }
+
+
+class MotionBlender:
+    """
+    Moteur de mouvement en flux continu.
+
+    step(dt) retourne la commande suivante (pose de la tête, antennes).
+    set_target() peut être appelé à tout moment, y compris depuis un autre
+    thread : le mouvement passe alors progressivement vers la nouvelle
+    émotion sur blend_time secondes, sans arrêter le flux de commandes.
+
+    Pendant une transition, chaque paramètre (centre, amplitude, fréquence,
+    antennes) est interpolé entre sa valeur au moment du changement et sa
+    valeur pour la nouvelle émotion. Les oscillations sont intégrées en phase,
+    donc un changement de fréquence ne crée aucun saut de position.
+    """
+
+    def __init__(self, pleasure, arousal, dominance, duration,
+                 blend_time: float = 1.0, motion: str = "yes", yaw_side=None):
+        if motion not in MOTIONS:
+            raise ValueError(f"Mouvement inconnu : {motion} (disponibles : {list(MOTIONS)})")
+        self.axis = MOTIONS[motion]
+        self.blend_time = blend_time
+        self.yaw_side = yaw_side
+
+        self._target = EmotionTarget(pleasure, arousal, dominance, duration, yaw_side)
+        self._source = None            # valeurs figées au début de la transition
+        self._pending = None           # prochaine cible demandée (écrite par un autre thread)
+        self._pending_lock = threading.Lock()
+        self._t_target = 0.0           # temps depuis l'arrivée de la cible
+        self._t_blend = 0.0            # avancement de la transition
+        self._blend_duration = blend_time
+
+        self._head = PhaseOscillator()
+        self._antennas = PhaseOscillator()
+        self.current = self._target.values(0.0)
+
+        # pose centrale et composition préallouées, mises à jour en place
+        self._center = np.eye(4)
+        self._composer = PoseComposer(self._center, self.axis)
+        self._center_values = None
+
+    def set_target(self, pleasure, arousal, dominance, duration=None, blend_time=None) -> None:
+        """Demande une nouvelle émotion ; prise en compte au prochain step()."""
+        if duration is None:
+            duration = self._target.duration
+        pending = (pleasure, arousal, dominance, duration,
+                   self.blend_time if blend_time is None else blend_time)
+        with self._pending_lock:
+            self._pending = pending
+
+    @property
+    def blending(self) -> bool:
+        return self._source is not None
+
+    def _apply_pending(self) -> None:
+        # échange atomique : une cible écrite entre la lecture et la remise à None serait perdue
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        pleasure, arousal, dominance, duration, blend_time = pending
+        self._source = dict(self.current)
+        self._target = EmotionTarget(pleasure, arousal, dominance, duration, self.yaw_side)
+        self._t_target = 0.0
+        self._t_blend = 0.0
+        self._blend_duration = blend_time
+
+    def _update(self) -> dict:
+        """Valeurs courantes des paramètres, transition comprise."""
+        if self._pending is not None:
+            self._apply_pending()
+
+        values = self._target.values(self._t_target)
+        if self._source is not None:
+            w = smoothstep(self._t_blend / self._blend_duration) if self._blend_duration > 0 else 1.0
+            for k in BLENDED:
+                values[k] = self._source[k] + w * (values[k] - self._source[k])
+            if w >= 1.0:
+                self._source = None
+        self.current = values
+        return values
+
+    def _integrate(self, values: dict, dt: float) -> None:
+        self._head.skip(values["frequency"], dt)
+        self._antennas.skip(values["ant_frequency"], dt)
+        self._t_target += dt
+        self._t_blend += dt
+
+    def advance(self, dt: float) -> None:
+        """Avance de dt secondes sans produire de commande (itérations sautées)."""
+        self._integrate(self._update(), dt)
+
+    def step(self, dt: float) -> tuple[np.ndarray, list[float]]:
+        """
+        Retourne la commande courante (pose 4x4 de la tête, [right, left]) puis avance de dt secondes.
+        La pose est écrite dans un buffer réutilisé : elle n'est valable que jusqu'au step() suivant.
+        """
+        values = self._update()
+
+        # --- TÊTE : oscillation autour du centre ---
+        # le centre n'est recalculé que s'il a changé (pendant une transition)
+        center_values = (values["x"], values["z"], values["pitch"], values["yaw"])
+        if center_values != self._center_values:
+            self._center_values = center_values
+            euler_to_matrix(0.0, np.radians(values["pitch"]), np.radians(values["yaw"]), out=self._center[:3, :3])
+            self._center[:3, 3] = [values["x"], 0.0, values["z"]]
+            self._composer.set_center(self._center)
+
+        head = self._composer.pose(values["amplitude"] * np.sin(self._head.phase))
+
+        # --- ANTENNES ---
+        ant = values["ant_center"] + values["ant_amplitude"] * np.sin(self._antennas.phase)
+        antennas = [-values["ant_side"] * ant, values["ant_side"] * ant]
+
+        # --- intégration des phases ---
+        self._integrate(values, dt)
+
+        return head, antennas
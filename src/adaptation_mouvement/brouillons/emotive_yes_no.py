@@ -1,13 +1,17 @@
 """Reachy Mini example that plays yes/no motions driven by a sine wave."""
 
+import sys
 import time
+from pathlib import Path
 from typing import Literal
 
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
 from reachy_mini import ReachyMini
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from pose_math import AXES, PoseComposer
+
 
 def prompt_float(prompt: str, default: float) -> float:
     """Ask the user for a float while supporting defaults."""
@@ -45,20 +49,17 @@ def main() -> None:
 
     with ReachyMini(media_backend="no_media") as reachy_mini:
         reachy_mini.goto_target(np.eye(4), antennas=[0.0, 0.0], duration=1.0)
-        pose = np.eye(4)
         base_antennas = [0.0, 0.0]
 
+        # pitch only for "yes", yaw only for "no"; the pose buffer is reused every tick
+        composer = PoseComposer(np.eye(4), AXES["pitch"] if motion_type == "yes" else AXES["yaw"])
+
         try:
             t0 = time.time()
             while True:
                 t = time.time() - t0
                 angle = amplitude * np.sin(2 * np.pi * frequency * t)
-                if motion_type == "yes":
-                    euler_rot = np.array([0.0, angle, 0.0])  # pitch only
-                else:
-                    euler_rot = np.array([0.0, 0.0, angle])  # yaw only
-
-                pose[:3, :3] = R.from_euler("xyz", euler_rot, degrees=False).as_matrix()
+                pose = composer.pose(angle)
                 reachy_mini.set_target(head=pose, antennas=base_antennas)
                 time.sleep(0.01)
         except KeyboardInterrupt:
@@ -0,0 +1,139 @@
+import argparse
+import json
+import sys
+
+from prompts.prompt_emotion_PAD import emotion_registry, get_emotion_PAD
+from prompts.prompt_duration import get_duration
+from trajectory import MOTIONS
+from reachy_local import BACKENDS
+
+DEFAULT_DURATION = 10.0
+DEFAULT_BLEND_TIME = 1.0
+DEFAULT_MIN_DELTA = 0.0  # suppression des petits écarts sur demande uniquement
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="adapt",
+        description="Adaptation d'un mouvement de Reachy Mini selon des valeurs PAD.",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--emotion", choices=emotion_registry().names(),
+                        help="émotion prédéfinie (valeurs PAD de Mehrabian et Russell)")
+    source.add_argument("--pad", nargs=3, type=float, metavar=("P", "A", "D"),
+                        help="valeurs pleasure, arousal, dominance dans [-1, 1]")
+    parser.add_argument("--duration", type=float, help=f"durée du mouvement en secondes (défaut {DEFAULT_DURATION})")
+    parser.add_argument("--motion", choices=list(MOTIONS), help="type de mouvement (défaut yes)")
+    parser.add_argument("--config", help="fichier JSON : emotion ou pleasure/arousal/dominance, duration, motion, profile, backend, min_delta, max_rate, live, blend_time")
+    parser.add_argument("--profile", action="store_true", default=None,
+                        help="active l'instrumentation de la boucle (équivalent à REACHY_PROFILE=1)")
+    parser.add_argument("--backend", choices=BACKENDS,
+                        help="robot réel (défaut) ou robot simulé localement, sans daemon")
+    parser.add_argument("--min-delta", type=float,
+                        help="écart minimal (rad) entre deux commandes envoyées, par ex. 0.001 ; "
+                             "par défaut 0 : toutes les commandes sont envoyées")
+    parser.add_argument("--max-rate", type=float,
+                        help="débit maximal de commandes envoyées au robot (Hz, illimité par défaut)")
+    parser.add_argument("--live", action="store_true", default=None,
+                        help="mode continu : de nouvelles émotions sont lues sur l'entrée standard")
+    parser.add_argument("--blend-time", type=float,
+                        help=f"durée des transitions entre émotions en mode continu (défaut {DEFAULT_BLEND_TIME} s)")
+    return parser
+
+
+def parse_pad_line(line: str) -> tuple[float, float, float] | None:
+    """
+    Interprète une ligne du mode continu : un nom d'émotion ("joy")
+    ou trois valeurs PAD ("0.4 0.6 -0.1"). Retourne None si la ligne est invalide.
+    """
+    pad = emotion_registry().get(line)
+    if pad is not None:
+        return pad
+    try:
+        values = [float(v) for v in line.replace(",", " ").split()]
+    except ValueError:
+        return None
+    if len(values) != 3:
+        return None
+    pleasure, arousal, dominance = (max(-1.0, min(1.0, v)) for v in values)
+    return pleasure, arousal, dominance
+
+
+def load_config(argv: list[str] | None = None) -> dict:
+    """
+    Construit la configuration d'un lancement à partir des arguments
+    et, éventuellement, d'un fichier JSON (les arguments sont prioritaires).
+
+    Les valeurs absentes ne sont demandées à l'utilisateur que si l'entrée
+    standard est un terminal, pour qu'un lancement par un superviseur ne
+    bloque jamais. Sinon, une émotion absente est une erreur d'usage (sauf en
+    mode continu, qui part de la première émotion de la table et l'annonce sur
+    stderr) et la durée absente vaut DEFAULT_DURATION.
+
+    Retourne {"pleasure", "arousal", "dominance", "duration", "motion", "profile", "backend",
+              "min_delta", "max_rate", "live", "blend_time"}.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    config = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    # --- PAD ---
+    if args.pad is not None:
+        pad = tuple(args.pad)
+    elif args.emotion is not None:
+        pad = emotion_registry().get(args.emotion)
+    elif "emotion" in config:
+        pad = emotion_registry().get(config["emotion"])
+        if pad is None:
+            raise ValueError(f"Émotion inconnue : {config['emotion']} (disponibles : {emotion_registry().names()})")
+    elif all(k in config for k in ("pleasure", "arousal", "dominance")):
+        pad = (config["pleasure"], config["arousal"], config["dominance"])
+    elif sys.stdin.isatty():
+        pad = get_emotion_PAD()
+    elif args.live or config.get("live", False):
+        name = emotion_registry().names()[0]
+        pad = emotion_registry().get(name)
+        print(f"Aucune émotion donnée : départ sur {name} {pad}", file=sys.stderr)
+    else:
+        parser.error("aucune émotion donnée (--emotion, --pad ou --config) "
+                     "et l'entrée standard n'est pas un terminal")
+    pleasure, arousal, dominance = (max(-1.0, min(1.0, float(v))) for v in pad)
+
+    # --- Durée ---
+    duration = args.duration if args.duration is not None else config.get("duration")
+    if duration is None:
+        duration = get_duration(DEFAULT_DURATION) if sys.stdin.isatty() else DEFAULT_DURATION
+    if duration <= 0:
+        raise ValueError(f"Durée invalide : {duration}")
+
+    # --- Mouvement ---
+    motion = args.motion or config.get("motion", "yes")
+    if motion not in MOTIONS:
+        raise ValueError(f"Mouvement inconnu : {motion} (disponibles : {list(MOTIONS)})")
+
+    profile = args.profile if args.profile is not None else config.get("profile")
+    backend = args.backend or config.get("backend", "robot")
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend inconnu : {backend} (disponibles : {BACKENDS})")
+    min_delta = args.min_delta if args.min_delta is not None else config.get("min_delta", DEFAULT_MIN_DELTA)
+    max_rate = args.max_rate if args.max_rate is not None else config.get("max_rate")
+    live = bool(args.live if args.live is not None else config.get("live", False))
+    blend_time = args.blend_time if args.blend_time is not None else config.get("blend_time", DEFAULT_BLEND_TIME)
+
+    return {
+        "pleasure": pleasure,
+        "arousal": arousal,
+        "dominance": dominance,
+        "duration": float(duration),
+        "motion": motion,
+        "profile": profile,
+        "backend": backend,
+        "min_delta": float(min_delta),
+        "max_rate": max_rate,
+        "live": live,
+        "blend_time": float(blend_time),
+    }
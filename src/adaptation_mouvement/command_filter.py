@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+
+
+class CommandFilter:
+    """
+    Étage de sortie entre la trajectoire et mini.set_target.
+
+    - Suppression des deltas : une commande trop proche de la dernière
+      commande envoyée (écart sous les seuils) n'est pas transmise.
+      La comparaison se fait avec la dernière commande *envoyée*, donc
+      une dérive lente finit toujours par être transmise.
+    - Limitation de débit : au plus max_rate commandes par seconde en moyenne ;
+      une commande arrivée trop tôt est gardée en attente et remplacée
+      par les suivantes (coalescence). Les créneaux d'envoi sont espacés de
+      1 / max_rate à partir du créneau précédent (et non de l'envoi effectif),
+      pour que le débit obtenu ne tombe pas sous max_rate quand la boucle
+      tourne à une période proche.
+
+    Seuils : rotation (écart max des coefficients de la matrice, ≈ rad),
+    translation (m) et antennes (rad). Tous à 0 : aucune suppression,
+    même des commandes identiques.
+    """
+
+    def __init__(self, send, rotation_threshold: float = 1e-3,
+                 translation_threshold: float = 1e-4,
+                 antennas_threshold: float = 1e-3,
+                 max_rate: float | None = None,
+                 clock=time.perf_counter):
+        self._send = send
+        self.rotation_threshold = rotation_threshold
+        self.translation_threshold = translation_threshold
+        self.antennas_threshold = antennas_threshold
+        self._suppress = max(rotation_threshold, translation_threshold, antennas_threshold) > 0
+        self.min_interval = 1.0 / max_rate if max_rate else 0.0
+        self._clock = clock
+
+        self._last_head = None
+        self._last_antennas = None
+        self._next_slot = -np.inf
+        self._pending = None
+
+        # --- compteurs ---
+        self.received = 0
+        self.sent = 0
+        self.suppressed = 0      # écart sous les seuils
+        self.coalesced = 0       # remplacées par une commande plus récente (débit)
+
+    def _changed(self, head, antennas) -> bool:
+        if self._last_head is None or not self._suppress:
+            return True
+        return (
+            np.abs(head[:3, :3] - self._last_head[:3, :3]).max() > self.rotation_threshold
+            or np.abs(head[:3, 3] - self._last_head[:3, 3]).max() > self.translation_threshold
+            or np.abs(np.subtract(antennas, self._last_antennas)).max() > self.antennas_threshold
+        )
+
+    def _emit(self, head, antennas, now) -> None:
+        self._send(head=head, antennas=antennas)
+        self._last_head = np.array(head, dtype=float)
+        self._last_antennas = np.array(antennas, dtype=float)
+        # créneau suivant ; après une pause, pas plus d'une demi-période d'avance
+        self._next_slot = max(self._next_slot, now - 0.5 * self.min_interval) + self.min_interval
+        self.sent += 1
+
+    def send(self, head, antennas) -> bool:
+        """Propose une commande ; retourne True si elle a été transmise."""
+        self.received += 1
+        if self._pending is not None:
+            # la commande en attente est remplacée par celle-ci
+            self.coalesced += 1
+            self._pending = None
+
+        if not self._changed(head, antennas):
+            self.suppressed += 1
+            return False
+
+        now = self._clock()
+        if now < self._next_slot:
+            # copies : l'appelant réutilise ses buffers (MotionBlender, PoseComposer)
+            self._pending = (np.array(head, dtype=float), np.array(antennas, dtype=float))
+            return False
+
+        self._emit(head, antennas, now)
+        return True
+
+    def flush(self) -> None:
+        """Transmet la dernière commande en attente (fin de mouvement)."""
+        if self._pending is not None:
+            head, antennas = self._pending
+            self._pending = None
+            self._emit(head, antennas, self._clock())
+
+    def stats(self) -> dict:
+        saved = self.received - self.sent
+        return {
+            "received": self.received,
+            "sent": self.sent,
+            "suppressed": self.suppressed,
+            "coalesced": self.coalesced,
+            "saved": saved,
+            "saved_ratio": saved / self.received if self.received else 0.0,
+        }
@@ -12,6 +12,7 @@ def amp_max_yes(
     ET de l'arousal
 
     Retourne une amplitude en radians
+    (arousal et z_norm peuvent aussi être des tableaux NumPy)
     """
     # amplification non linéaire aux extrêmes (inverse de avant)
     amplification = (1.0 - z_norm) ** 2
@@ -1,5 +1,5 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm, signed_norm
+from normalsiation_PAD.norm import positive_norm, signed_norm, positive_norm_array, signed_norm_array
 
 def head_amplitude(t, arousal, dominance, A_phys_max, duration):
     """
@@ -49,4 +49,36 @@ def head_amplitude(t, arousal, dominance, A_phys_max, duration):
             decay_progress = (t - growth_time) / (duration - growth_time)
             decay_progress = np.clip(decay_progress, 0.0, 1.0)
             # cos(pi/2 * 0) = 1 → commence à A_max ; cos(pi/2 * 1) = 0 → fini à 0
-            return A_max * np.cos(np.pi/2 * decay_progress)
\ No newline at end of file
+            return A_max * np.cos(np.pi/2 * decay_progress)
+
+
+def head_amplitude_batch(t, arousal, dominance, A_phys_max, duration):
+    """
+    Version vectorisée de head_amplitude : t, arousal, dominance et A_phys_max
+    peuvent être des tableaux NumPy (broadcast entre eux).
+    Résultats identiques à head_amplitude appliquée élément par élément.
+    """
+    t = np.asarray(t, dtype=float)
+
+    arousal_norm = positive_norm_array("Arousal", arousal)
+    min_ratio=0.1
+    max_ratio=0.5
+    growth_ratio = max_ratio - arousal_norm * (max_ratio - min_ratio)
+    growth_time = duration * growth_ratio
+
+    dom_norm = signed_norm_array("Dominance", dominance)
+    factor = 0.6 + 0.4 * (dom_norm + 1) / 2
+    A_max = A_phys_max * factor
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Crescendo : croissance douce puis plateau
+        crescendo = np.where(t < growth_time, A_max * np.sin(np.pi/2 * (t / growth_time)), A_max)
+
+        # Decrescendo : plateau puis décroissance douce
+        decay_progress = np.clip((t - growth_time) / (duration - growth_time), 0.0, 1.0)
+        decrescendo = np.where(t < growth_time, A_max, A_max * np.cos(np.pi/2 * decay_progress))
+
+    amplitude = np.where(np.asarray(dominance) >= 0, crescendo, decrescendo)
+
+    # Fin du mouvement
+    return np.where(t >= duration, 0.0, amplitude)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm, signed_norm
+from normalsiation_PAD.norm import positive_norm, signed_norm, positive_norm_array, signed_norm_array
 
 def head_frequency(A_t, pleasure, arousal, A_max=0.3):
     """
@@ -30,4 +30,22 @@ def head_frequency(A_t, pleasure, arousal, A_max=0.3):
     # arousal ≈ 0 → pas de modif, arousal ≈ 1 → fréquence augmentée jusqu'à +30%
     f_t *= 1.0 + 0.2 * arousal_norm
 
-    return f_t
\ No newline at end of file
+    return f_t
+
+
+def head_frequency_batch(A_t, pleasure, arousal, A_max=0.3):
+    """
+    Version vectorisée de head_frequency : tous les arguments peuvent être
+    des tableaux NumPy (broadcast entre eux).
+    """
+    pleasure_norm = signed_norm_array("Pleasure", pleasure)
+    arousal_norm = positive_norm_array("Arousal", arousal)
+
+    pleasure_factor = 1.0 + 0.5 * pleasure_norm
+    f_min = 0.5 * pleasure_factor
+    f_max = 2.0 * pleasure_factor
+
+    A_ratio = np.clip(np.asarray(A_t) / A_max, 0.0, 1.0)
+    f_t = f_min + (f_max - f_min) * A_ratio
+
+    return f_t * (1.0 + 0.2 * arousal_norm)
\ No newline at end of file
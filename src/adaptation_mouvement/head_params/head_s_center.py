@@ -1,13 +1,15 @@
 import numpy as np
-from normalsiation_PAD.norm import positive_norm, signed_norm
+from normalsiation_PAD.norm import positive_norm, signed_norm, positive_norm_array, signed_norm_array
 
-def head_s_center(pleasure: float, arousal: float, dominance: float) -> tuple[float, float, float, float, float]:
+def head_s_center(pleasure: float, arousal: float, dominance: float, yaw_side: float | None = None) -> tuple[float, float, float, float, float]:
     """
     Détermine le centre du mouvement 
 
     - Le pleasure influence le pitch_center (tête vers le haut/bas)
     - La dominance influence le z_center (tente sortie/rentrée), le x_center (tête avant /arrière), et le yaw_center (tête légèrement tournée)
     - L'arousal sert de facteur pour savoir à quel point le mouvement est loin du centre neutre.
+
+    yaw_side (-1 ou 1) fixe le côté vers lequel la tête se tourne, tiré au hasard si None.
     """
     # NORMALISATION DES VALEURS
     pleasure_norm = signed_norm("Pleasure", pleasure)  # → [-1, 1]
@@ -47,7 +49,8 @@ def head_s_center(pleasure: float, arousal: float, dominance: float) -> tuple[fl
         # Le plus petit intervalle de yaw est [-3,3]
         # Reachy ne tourne la tête que s'il ne veut pas affronter la situation = que si dominance < 0
         # La direction du yaw est choisie aléatoirement
-    yaw_side = np.random.choice([-1.0, 1.0])
+    if yaw_side is None:
+        yaw_side = np.random.choice([-1.0, 1.0])
     
     # Par défaut yaw_center = 0
     yaw_center = 0.0
@@ -96,4 +99,60 @@ def head_s_center(pleasure: float, arousal: float, dominance: float) -> tuple[fl
         # tête vers le bas → pitch positif
         pitch_center = -pitch_max_eff * pleasure_norm * arousal_norm
 
+    return x_center, z_center, pitch_center, yaw_center, z_norm
+
+
+def head_s_center_batch(pleasure, arousal, dominance, yaw_side=None):
+    """
+    Version vectorisée de head_s_center : pleasure, arousal, dominance
+    (et yaw_side) peuvent être des tableaux NumPy, broadcast entre eux.
+    Résultats identiques (à l'arrondi flottant de `**` près) à head_s_center
+    appliquée élément par élément pour les mêmes yaw_side.
+
+    Retourne (x_center, z_center, pitch_center, yaw_center, z_norm) sous forme de tableaux.
+    """
+    pleasure, arousal, dominance = np.broadcast_arrays(
+        np.asarray(pleasure, dtype=float),
+        np.asarray(arousal, dtype=float),
+        np.asarray(dominance, dtype=float),
+    )
+    pleasure_norm = signed_norm_array("Pleasure", pleasure)
+    arousal_norm = positive_norm_array("Arousal", arousal)
+    dom_norm = positive_norm_array("Dominance", dominance)
+
+    # --- z_center ---
+    z_min=-0.050 
+    z_max=0.025
+    z_center = np.where(dominance >= 0, z_max, z_min) * dom_norm * arousal_norm
+    z_norm = np.where(z_center >= 0, np.abs(z_center) / z_max, np.abs(z_center) / abs(z_min))
+
+    # --- x_center ---
+    x_max_abs = 0.10
+    x_reduction = (1.0 - z_norm) ** 1.5
+    x_max_eff = x_max_abs * x_reduction
+    x_center = np.sign(dominance) * x_max_eff * dom_norm * arousal_norm
+
+    # --- yaw_center (uniquement si dominance < 0) ---
+    if yaw_side is None:
+        yaw_side = np.random.choice([-1.0, 1.0], size=pleasure.shape)
+    yaw_max_abs = 25.0
+    yaw_min_abs = 3.0
+    yaw_reduction = (1.0 - z_norm) ** 2
+    yaw_max_eff = yaw_min_abs + (yaw_max_abs - yaw_min_abs) * yaw_reduction
+    yaw_center = np.where(
+        dominance < 0,
+        yaw_side * yaw_max_eff * (1.0 - dom_norm) * arousal_norm,
+        0.0,
+    )
+
+    # --- pitch_center ---
+    pitch_min = -40.0
+    pitch_max =  30.0
+    pitch_min_neutral = -5.0
+    pitch_max_neutral =  5.0
+    pitch_reduction = (1.0 - z_norm) ** 1.5
+    pitch_min_eff = pitch_min_neutral + (pitch_min - pitch_min_neutral) * (1.0 - pitch_reduction)
+    pitch_max_eff = pitch_max_neutral + (pitch_max - pitch_max_neutral) * (1.0 - pitch_reduction)
+    pitch_center = np.where(pleasure_norm >= 0, pitch_min_eff, -pitch_max_eff) * pleasure_norm * arousal_norm
+
     return x_center, z_center, pitch_center, yaw_center, z_norm
\ No newline at end of file
@@ -0,0 +1,162 @@
+import os
+import signal
+import time
+
+import numpy as np
+
+# Variable d'environnement qui active l'instrumentation (ex : REACHY_PROFILE=1)
+ENV_FLAG = "REACHY_PROFILE"
+
+
+class LoopProfiler:
+    """
+    Mesure la durée de chaque phase d'une boucle de contrôle.
+
+    Les durées sont écrites dans un buffer circulaire préalloué
+    (pas d'allocation pendant la boucle) : une ligne par itération,
+    une colonne par phase, plus l'instant de début de l'itération.
+
+    Utilisation :
+        profiler.begin()
+        ...                      # calcul
+        profiler.mark(0)         # fin de la phase 0
+        ...                      # envoi
+        profiler.mark(1)         # fin de la phase 1
+        profiler.end()
+    """
+
+    def __init__(self, phases: tuple[str, ...], capacity: int = 8192,
+                 period: float | None = None, clock=time.perf_counter):
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self.period = period       # période attendue, pour le calcul du jitter
+        self._clock = clock
+
+        # colonnes : durées des phases (s) puis début de l'itération (horloge)
+        self._buffer = np.zeros((capacity, len(self.phases) + 1))
+        self._start_col = len(self.phases)
+        self._row = self._buffer[0]
+        self._last = 0.0
+        self.count = 0             # nombre total d'itérations enregistrées
+        self.missed = 0            # échéances manquées signalées par la boucle
+
+    # --- enregistrement (chemin critique) ---
+    def begin(self) -> None:
+        self._row = self._buffer[self.count % self.capacity]
+        self._last = self._clock()
+        self._row[self._start_col] = self._last
+
+    def mark(self, phase: int) -> None:
+        now = self._clock()
+        self._row[phase] = now - self._last
+        self._last = now
+
+    def end(self, missed: bool = False) -> None:
+        self.count += 1
+        if missed:
+            self.missed += 1
+
+    # --- analyse (hors boucle) ---
+    def samples(self) -> np.ndarray:
+        """Lignes valides du buffer, dans l'ordre chronologique."""
+        if self.count <= self.capacity:
+            return self._buffer[:self.count]
+        start = self.count % self.capacity
+        return np.roll(self._buffer, -start, axis=0)
+
+    def summary(self) -> dict:
+        """Statistiques p50 / p99 / max (en ms) par phase et pour l'itération complète."""
+        data = self.samples()
+        if len(data) == 0:
+            return {}
+
+        durations = data[:, :self._start_col]
+        columns = {name: durations[:, i] for i, name in enumerate(self.phases)}
+        columns["total"] = durations.sum(axis=1)
+
+        stats = {}
+        for name, values in columns.items():
+            ms = values * 1e3
+            stats[name] = {
+                "p50": float(np.percentile(ms, 50)),
+                "p99": float(np.percentile(ms, 99)),
+                "max": float(ms.max()),
+            }
+
+        # jitter : écart entre la période réelle et la période attendue
+        if self.period is not None and len(data) > 1:
+            jitter = (np.diff(data[:, self._start_col]) - self.period) * 1e3
+            stats["jitter"] = {
+                "p50": float(np.percentile(np.abs(jitter), 50)),
+                "p99": float(np.percentile(np.abs(jitter), 99)),
+                "max": float(np.abs(jitter).max()),
+            }
+        return stats
+
+    def histogram(self, column: str = "total", bins: int = 12) -> tuple[np.ndarray, np.ndarray]:
+        """Histogramme (bornes log en ms) d'une phase ou de l'itération complète."""
+        data = self.samples()
+        durations = data[:, :self._start_col]
+        if column == "total":
+            values = durations.sum(axis=1)
+        else:
+            values = durations[:, self.phases.index(column)]
+        ms = np.maximum(values * 1e3, 1e-3)
+        edges = np.logspace(np.log10(ms.min()), np.log10(ms.max()) + 1e-9, bins + 1)
+        counts, edges = np.histogram(ms, bins=edges)
+        return counts, edges
+
+    def report(self, extra: dict | None = None) -> None:
+        """Affiche le résumé des latences et l'histogramme de l'itération complète."""
+        print(f"\n--- Instrumentation : {self.count} itérations, {self.missed} échéances manquées ---")
+        if extra:
+            print(" ".join(f"{k}={v}" for k, v in extra.items()))
+
+        for name, s in self.summary().items():
+            print(f"{name:>12} : p50={s['p50']:.3f} ms  p99={s['p99']:.3f} ms  max={s['max']:.3f} ms")
+
+        if self.count == 0:
+            return
+        counts, edges = self.histogram()
+        width = max(int(counts.max()), 1)
+        for c, lo, hi in zip(counts, edges[:-1], edges[1:]):
+            print(f"{lo:8.3f} - {hi:8.3f} ms | {'#' * int(40 * c / width)} {c}")
+
+    def install_signal_handler(self, extra=None) -> None:
+        """Affiche le rapport à la réception de SIGUSR1 (si la plateforme le permet)."""
+        if not hasattr(signal, "SIGUSR1"):
+            return
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.report(extra() if extra else None))
+
+
+class NullProfiler:
+    """Même interface que LoopProfiler, sans aucun coût : utilisé quand l'instrumentation est désactivée."""
+
+    count = 0
+    missed = 0
+
+    def begin(self) -> None:
+        pass
+
+    def mark(self, phase: int) -> None:
+        pass
+
+    def end(self, missed: bool = False) -> None:
+        pass
+
+    def report(self, extra: dict | None = None) -> None:
+        pass
+
+    def install_signal_handler(self, extra=None) -> None:
+        pass
+
+
+def make_profiler(phases: tuple[str, ...], enabled: bool | None = None, **kwargs):
+    """
+    Retourne un LoopProfiler si l'instrumentation est activée,
+    sinon un NullProfiler.
+    Par défaut l'activation est lue dans la variable d'environnement REACHY_PROFILE.
+    """
+    if enabled is None:
+        enabled = os.environ.get(ENV_FLAG, "") not in ("", "0")
+    return LoopProfiler(phases, **kwargs) if enabled else NullProfiler()
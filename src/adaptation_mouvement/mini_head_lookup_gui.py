@@ -2,7 +2,6 @@
     Viens de la librairie reachy_mini. M'a beaucoup servi pour faire des tests.
 """
 
-import time
 import tkinter as tk
 
 import numpy as np
@@ -10,12 +9,14 @@ import numpy as np
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
 
+from scheduler import FixedRateScheduler
+
+CONTROL_PERIOD = 0.02  # s, cadence de la boucle de commande (50 Hz)
+
 
 def main():
     """Run a GUI to set the head position and orientation of Reachy Mini."""
     with ReachyMini(media_backend="no_media") as mini:
-        t0 = time.time()
-
         root = tk.Tk()
         root.title("Set Look At XYZ Position")
 
@@ -72,9 +73,12 @@ def main():
         # Run the GUI in a non-blocking way
         root.update()
 
+        scheduler = FixedRateScheduler(CONTROL_PERIOD, policy="skip")
+
         try:
             while True:
-                t = time.time() - t0
+                scheduler.wait()
+                t = scheduler.t
                 target = np.deg2rad(30) * np.sin(2 * np.pi * 0.5 * t)
 
                 head = np.eye(4)
@@ -1,3 +1,4 @@
+import numpy as np
 from .params import BOUNDS
 
 def positive_norm(param_type: str, value: float) -> float:
@@ -18,4 +19,21 @@ def signed_norm(param_type: str, value: float) -> float:
     """
     min_val, max_val = BOUNDS[param_type]
     value_clipped = max(min_val, min(max_val, value))
-    return 2 * ((value_clipped - min_val) / (max_val - min_val)) - 1
\ No newline at end of file
+    return 2 * ((value_clipped - min_val) / (max_val - min_val)) - 1
+
+def positive_norm_array(param_type: str, value):
+    """
+    Version vectorisée de positive_norm : accepte un scalaire ou un tableau NumPy.
+    """
+    min_val, max_val = BOUNDS[param_type]
+    value_clipped = np.clip(value, min_val, max_val)
+    return (value_clipped - min_val) / (max_val - min_val)
+
+
+def signed_norm_array(param_type: str, value):
+    """
+    Version vectorisée de signed_norm : accepte un scalaire ou un tableau NumPy.
+    """
+    min_val, max_val = BOUNDS[param_type]
+    value_clipped = np.clip(value, min_val, max_val)
+    return 2 * ((value_clipped - min_val) / (max_val - min_val)) - 1
@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+
+TWO_PI = 2 * math.pi
+
+
+class PhaseOscillator:
+    """
+    Oscillateur à accumulateur de phase.
+
+    La phase est intégrée pas à pas (phase += 2π f dt) au lieu d'être
+    recalculée comme 2π f(t) t : une fréquence qui varie dans le temps
+    ne provoque aucun saut de phase, et le coût par échantillon reste
+    constant quelle que soit la durée (pas besoin du temps absolu).
+
+    Convention : l'échantillon retourné correspond à la phase courante,
+    la phase avance ensuite de dt (le premier échantillon vaut sin(phase0)).
+    """
+
+    __slots__ = ("phase",)
+
+    def __init__(self, phase: float = 0.0):
+        self.phase = phase
+
+    def step(self, frequency: float, dt: float) -> float:
+        """Retourne sin(phase) puis avance d'un pas de dt à la fréquence donnée (Hz)."""
+        value = math.sin(self.phase)
+        self.phase = (self.phase + TWO_PI * frequency * dt) % TWO_PI
+        return value
+
+    def skip(self, frequency: float, dt: float) -> None:
+        """Avance de dt sans produire d'échantillon."""
+        self.phase = (self.phase + TWO_PI * frequency * dt) % TWO_PI
+
+    def advance(self, frequencies, dt: float) -> np.ndarray:
+        """
+        Avance de N pas en une fois (une fréquence par pas) et retourne
+        les N phases correspondantes, pour un calcul en lot (np.sin(phases)).
+        """
+        increments = TWO_PI * np.asarray(frequencies, dtype=float) * dt
+        if increments.size == 0:
+            return increments
+        phases = np.empty_like(increments)
+        phases[0] = self.phase
+        np.cumsum(increments[:-1], out=phases[1:])
+        phases[1:] += self.phase
+        self.phase = float((phases[-1] + increments[-1]) % TWO_PI)
+        return phases
@@ -0,0 +1,78 @@
+import numpy as np
+
+# Axe de rotation : 0 = x (roll), 1 = y (pitch), 2 = z (yaw)
+AXES = {"roll": 0, "pitch": 1, "yaw": 2}
+
+
+def euler_to_matrix(roll, pitch, yaw, out=None) -> np.ndarray:
+    """
+    Matrice(s) de rotation pour des angles d'Euler extrinsèques "xyz" (radians),
+    même convention que scipy Rotation.from_euler("xyz", ...) et create_head_pose.
+    Accepte des scalaires (→ (3, 3)) ou des tableaux (→ (..., 3, 3)).
+    """
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+
+    shape = np.broadcast(cr, cp, cy).shape
+    if out is None:
+        out = np.empty(shape + (3, 3))
+    out[..., 0, 0] = cy * cp
+    out[..., 0, 1] = cy * sp * sr - sy * cr
+    out[..., 0, 2] = cy * sp * cr + sy * sr
+    out[..., 1, 0] = sy * cp
+    out[..., 1, 1] = sy * sp * sr + cy * cr
+    out[..., 1, 2] = sy * sp * cr - cy * sr
+    out[..., 2, 0] = -sp
+    out[..., 2, 1] = cp * sr
+    out[..., 2, 2] = cp * cr
+    return out
+
+
+class PoseComposer:
+    """
+    Compose une pose centrale fixe avec une rotation relative autour d'un axe :
+        pose = [R_center · R_axe(angle) | t_center]
+
+    La rotation centrale est extraite une seule fois. Pour un seul axe, le
+    produit se réduit à une combinaison de deux colonnes de R_center :
+        colonnes (i, j) ← (c·col_i + s'·col_j, c·col_j − s'·col_i)
+    ce qui évite toute allocation dans la boucle (pose() écrit dans `out`).
+    """
+
+    def __init__(self, pose_center: np.ndarray, axis: int):
+        self.center = np.array(pose_center, dtype=float)
+        self.axis = axis
+        self._i, self._j = [k for k in range(3) if k != axis]
+        # pour Ry le sens de rotation dans le plan (z, x) est inversé
+        self._sign = -1.0 if axis == 1 else 1.0
+        self._col_i = self.center[:3, self._i].copy()
+        self._col_j = self.center[:3, self._j].copy()
+        self.out = self.center.copy()
+
+    def set_center(self, pose_center: np.ndarray) -> None:
+        """Remplace la pose centrale (sans allocation)."""
+        self.center[:] = pose_center
+        self._col_i[:] = self.center[:3, self._i]
+        self._col_j[:] = self.center[:3, self._j]
+        self.out[:] = self.center
+
+    def pose(self, angle: float, out: np.ndarray | None = None) -> np.ndarray:
+        """Pose 4x4 pour un angle (rad) ; écrit dans `out` (par défaut un buffer réutilisé)."""
+        if out is None:
+            out = self.out
+        c = np.cos(angle)
+        s = self._sign * np.sin(angle)
+        out[:3, self._i] = c * self._col_i + s * self._col_j
+        out[:3, self._j] = c * self._col_j - s * self._col_i
+        return out
+
+    def batch(self, angles: np.ndarray) -> np.ndarray:
+        """Poses (N, 4, 4) pour N angles, calculées en une seule passe."""
+        angles = np.asarray(angles, dtype=float)
+        c = np.cos(angles)[:, np.newaxis]
+        s = self._sign * np.sin(angles)[:, np.newaxis]
+        poses = np.repeat(self.center[np.newaxis], len(angles), axis=0)
+        poses[:, :3, self._i] = c * self._col_i + s * self._col_j
+        poses[:, :3, self._j] = c * self._col_j - s * self._col_i
+        return poses
@@ -1,16 +1,14 @@
-# Quelques émotions avec les valeurs calculées par Mehrabian et Russell
-# Valence, Arousal, Dominance
-EMOTION_PAD = {
-    "joy":        ( 0.76,  0.48,  0.35),
-    "sadness":    (-0.63, 0.27, -0.33),
-    "anger":      (-0.43,  0.67,  -0.13),
-    "fear":       (-0.64,  0.6, -0.43),
-    "disgust":    (-0.6,  0.35,  0.11),
-    "surprise":   ( 0.4,  0.67,  -0.13),
-    #"scornfulness": (-0.5,  0.35,  -0.2),
-    #"relaxed":    ( 0.5, -0.2,  0.3),
-    #"mildness":   ( 0.2, -0.1,  0.1),
-}
+from emotion_registry import MEHRABIAN_TABLE, load_registry
+
+
+def emotion_registry():
+    """
+    Quelques émotions avec les valeurs calculées par Mehrabian et Russell
+    (Valence, Arousal, Dominance), lues dans prompts/pad_mehrabian.json.
+    Le fichier n'est chargé qu'une fois (rechargé s'il est modifié).
+    """
+    return load_registry(MEHRABIAN_TABLE)
+
 
 def get_emotion_PAD() -> tuple[float, float, float]:
     """
@@ -42,7 +40,7 @@ def get_emotion_PAD() -> tuple[float, float, float]:
         # Choix par émotions
         print("Pick an emotion by pressing Enter. The associated PAD values will be selected:")
 
-        emotions = list(EMOTION_PAD.keys())
+        emotions = emotion_registry().names()
         for i, emotion in enumerate(emotions, 1):
             print(f"{i}. {emotion.capitalize()}")
 
@@ -59,6 +57,6 @@ def get_emotion_PAD() -> tuple[float, float, float]:
             else:
                 print("Invalid input. Choose a number from the list or press Enter.")
 
-        pad = EMOTION_PAD[emotion]
+        pad = emotion_registry().get(emotion)
         print(f"Selected emotion: {emotion.capitalize()} -> PAD values: Pleasure={pad[0]}, Arousal={pad[1]}, Dominance={pad[2]}")
         return pad
\ No newline at end of file
@@ -0,0 +1,101 @@
+import time
+
+POLICIES = ("catch_up", "skip")
+
+
+class FixedRateScheduler:
+    """
+    Cadenceur à période fixe basé sur des échéances absolues.
+
+    Contrairement à `time.sleep(dt); t += dt`, le temps de calcul et les
+    dépassements de sommeil sont pris en compte : la k-ième itération est
+    calée sur t0 + k * period, donc la fréquence demandée est celle obtenue.
+
+    Politiques en cas de retard :
+        - "catch_up" : les itérations en retard sont exécutées sans attendre,
+                       l'une après l'autre, jusqu'à rattraper l'horloge
+        - "skip"     : les itérations manquées sont sautées, on reprend
+                       directement à l'échéance courante
+
+    Utilisation :
+        scheduler = FixedRateScheduler(dt, policy="skip")
+        while ...:
+            tick = scheduler.wait()     # index de l'itération à jouer
+            t = scheduler.t             # temps théorique de cette itération
+    """
+
+    def __init__(self, period: float, policy: str = "skip", tolerance: float = 1e-3,
+                 clock=time.perf_counter, sleep=time.sleep):
+        if period <= 0:
+            raise ValueError("La période doit être strictement positive")
+        if policy not in POLICIES:
+            raise ValueError(f"Politique inconnue : {policy} (disponibles : {POLICIES})")
+
+        self.period = period
+        self.policy = policy
+        self.tolerance = tolerance   # retard toléré avant de compter un dépassement (s)
+        self._clock = clock
+        self._sleep = sleep
+
+        self.t0 = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.tick = -1
+
+        # --- compteurs ---
+        self.executed = 0        # itérations effectivement jouées
+        self.overruns = 0        # itérations démarrées après leur échéance (+ tolérance)
+        self.skipped = 0         # itérations sautées (politique "skip")
+        self.max_lateness = 0.0  # pire retard observé (s)
+
+    def start(self) -> None:
+        """Fixe l'origine des temps. Appelé automatiquement au premier wait()."""
+        self.t0 = self._clock()
+        self._reset()
+
+    @property
+    def t(self) -> float:
+        """Temps théorique (s) de l'itération courante."""
+        return max(self.tick, 0) * self.period
+
+    def deadline(self, tick: int) -> float:
+        """Échéance absolue (horloge) de l'itération `tick`."""
+        return self.t0 + tick * self.period
+
+    def wait(self) -> int:
+        """
+        Attend l'échéance de la prochaine itération et retourne son index.
+        La première itération (index 0) démarre immédiatement.
+        """
+        if self.t0 is None:
+            self.start()
+
+        next_tick = self.tick + 1
+        now = self._clock()
+        lateness = now - self.deadline(next_tick)
+
+        if lateness < 0:
+            # en avance : on dort jusqu'à l'échéance
+            self._sleep(-lateness)
+        elif next_tick > 0 and lateness > self.tolerance:
+            # l'itération précédente a débordé sur celle-ci
+            self.overruns += 1
+            self.max_lateness = max(self.max_lateness, lateness)
+            if self.policy == "skip" and lateness >= self.period:
+                missed = int(lateness // self.period)
+                self.skipped += missed
+                next_tick += missed
+
+        self.tick = next_tick
+        self.executed += 1
+        return self.tick
+
+    def stats(self) -> dict:
+        """Compteurs de dépassement depuis le démarrage."""
+        return {
+            "executed": self.executed,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "max_lateness": self.max_lateness,
+        }
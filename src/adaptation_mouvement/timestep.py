@@ -7,13 +7,15 @@ def timestep(pleasure: float, arousal: float) -> float:
     - pleasure proche de 0 → mouvement plus rapide
     - pleasure éloigné de 0 → mouvement plus posé
     Cela change en partie la fluidité du mouvement
+
+    pleasure et arousal peuvent aussi être des tableaux NumPy.
     """
     arousal_clipped = np.clip(arousal, -0.7, 0.7)
     arousal_norm = (arousal_clipped + 0.7) / 1.4  # [0,1]
 
     # --- Pleasure ---
     pleasure_clipped = np.clip(pleasure, -0.8, 0.8)
-    pleasure_norm = abs(pleasure_clipped) / 0.8  # [0,1], 0 = centre, 1 = extrêmes
+    pleasure_norm = np.abs(pleasure_clipped) / 0.8  # [0,1], 0 = centre, 1 = extrêmes
 
     dt_min = 0.01   # rapide mais safe
     dt_max = 0.05   # lent, posé
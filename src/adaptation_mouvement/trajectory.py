@@ -0,0 +1,88 @@
+import numpy as np
+
+from pose_math import PoseComposer
+from oscillator import PhaseOscillator
+from antennas_params.ant_angles import ant_angles_batch
+from antennas_params.ant_center import ant_center
+from antennas_params.ant_frequency import ant_frequency_batch
+
+from head_params.head_s_center import head_s_center
+from head_params.head_amplitude import head_amplitude_batch
+from head_params.head_frequency import head_frequency_batch
+from head_params.head_amp_max import amp_max_yes
+
+# Mouvements disponibles et axe (x=roll, y=pitch, z=yaw) de l'oscillation
+MOTIONS = {
+    "yes": 1,
+}
+
+
+def render_trajectory(pleasure: float,
+                      arousal: float,
+                      dominance: float,
+                      duration: float,
+                      dt: float,
+                      motion: str = "yes",
+                      yaw_side: float | None = None) -> dict:
+    """
+    Calcule en une seule passe toute la trajectoire (tête + antennes)
+    d'un mouvement émotionnel, échantillonnée tous les dt secondes sur [0, duration].
+
+    La boucle de contrôle n'a plus qu'à indexer les tableaux retournés :
+        - "t"        : (N,)      instants des échantillons (s)
+        - "head"     : (N, 4, 4) poses de la tête
+        - "antennas" : (N, 2)    angles des antennes [right, left] (rad)
+        - "amplitude", "frequency" : (N,) paramètres de l'oscillation
+        - "pose_center", "base_antennas" : position de départ du mouvement
+
+    yaw_side (-1 ou 1) fixe le côté du yaw_center, tiré au hasard si None (cf. head_s_center).
+    """
+    if motion not in MOTIONS:
+        raise ValueError(f"Mouvement inconnu : {motion} (disponibles : {list(MOTIONS)})")
+
+    # import différé : inutile quand la trajectoire vient du cache
+    try:
+        from reachy_mini.utils import create_head_pose
+    except ImportError:
+        # sans SDK (banc de test local) : même convention, cf. reachy_local
+        from reachy_local import create_head_pose
+
+    # --- CENTRES DU MOUVEMENT (calculés une seule fois) ---
+    x_center, z_center, pitch_center, yaw_center, z_norm = head_s_center(pleasure, arousal, dominance, yaw_side)
+    base_antennas = ant_center(pleasure)
+    amp_max = amp_max_yes(arousal=arousal, z_norm=z_norm)
+
+    pose_center = create_head_pose(
+        x=x_center,
+        z=z_center,
+        pitch=pitch_center,
+        yaw=yaw_center
+    )
+
+    n = int(duration / dt) + 1
+    t = np.arange(n) * dt
+
+    # --- OSCILLATION AUTOUR DU CENTRE ---
+    amplitude = head_amplitude_batch(t, arousal, dominance, amp_max, duration)
+    # amp_max passé à la place de l'arousal (A_max reste à 0.3) : reproduit
+    # volontairement l'appel d'origine d'adapt.py, pour ne pas changer les mouvements
+    frequency = head_frequency_batch(amplitude, pleasure, amp_max)
+    # phase intégrée : pas de saut quand la fréquence suit l'amplitude
+    angle = amplitude * np.sin(PhaseOscillator().advance(frequency, dt))
+
+    # rotations relatives composées avec le centre en une seule passe (forme fermée)
+    head = PoseComposer(pose_center, MOTIONS[motion]).batch(angle)
+
+    # --- MOUVEMENTS ANTENNES ---
+    ant_phase = PhaseOscillator().advance(ant_frequency_batch(pleasure, t), dt)
+    antennas = ant_angles_batch(center=base_antennas, pleasure=pleasure, dominance=dominance, t=t, phase=ant_phase)
+
+    return {
+        "t": t,
+        "head": head,
+        "antennas": antennas,
+        "amplitude": amplitude,
+        "frequency": frequency,
+        "pose_center": pose_center,
+        "base_antennas": base_antennas,
+    }
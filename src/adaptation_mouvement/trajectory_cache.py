@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from trajectory import render_trajectory
+
+# Dossier du cache, modifiable via la variable d'environnement REACHY_TRAJECTORY_CACHE
+DEFAULT_ROOT = Path.home() / ".cache" / "reachy_mini_I3R" / "trajectories"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Tableaux stockés en .npy (ouverts en mmap à la lecture)
+ARRAY_KEYS = ("t", "head", "antennas", "amplitude", "frequency", "pose_center")
+
+# Sources dont dépend le rendu : toute modification invalide le cache
+_SOURCE_DIR = Path(__file__).parent
+_SOURCES = (
+    "trajectory.py",
+    "pose_math.py",
+    "oscillator.py",
+    "normalsiation_PAD/*.py",
+    "head_params/*.py",
+    "antennas_params/ant_*.py",
+)
+_code_version = None
+
+
+def code_version() -> str:
+    """Hash du code de génération des trajectoires (calculé une seule fois)."""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha1()
+        for pattern in _SOURCES:
+            for path in sorted(_SOURCE_DIR.glob(pattern)):
+                if path.name == "ant_main.py":
+                    continue
+                h.update(path.read_bytes())
+        _code_version = h.hexdigest()[:12]
+    return _code_version
+
+
+class TrajectoryCache:
+    """
+    Cache disque des trajectoires rendues par render_trajectory.
+
+    Chaque entrée est un dossier nommé par le hash de
+    (PAD quantifié, durée, dt, mouvement, côté du yaw, version du code),
+    contenant un .npy par tableau. Une lecture ne coûte qu'une ouverture mmap.
+    Le cache est borné en taille : les entrées les moins récemment utilisées
+    sont supprimées en premier (LRU, via la date de modification).
+    """
+
+    def __init__(self, root: str | Path | None = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 quantum: float = 0.01):
+        if root is None:
+            root = os.environ.get("REACHY_TRAJECTORY_CACHE", DEFAULT_ROOT)
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.quantum = quantum    # pas de quantification des valeurs PAD
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, value: float) -> float:
+        return round(round(value / self.quantum) * self.quantum, 6)
+
+    def key(self, pleasure, arousal, dominance, duration, dt, motion="yes", yaw_side=1.0) -> str:
+        params = {
+            "pad": [self.quantize(v) for v in (pleasure, arousal, dominance)],
+            "duration": round(float(duration), 3),
+            "dt": round(float(dt), 6),
+            "motion": motion,
+            "yaw_side": float(yaw_side),
+            "code": code_version(),
+        }
+        return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    # --- lecture / écriture ---
+    def get(self, key: str) -> dict | None:
+        """Ouvre une entrée en mmap, None si absente."""
+        entry = self.root / key
+        meta_path = entry / "meta.json"
+        if not meta_path.exists():
+            return None
+
+        with meta_path.open("r", encoding="utf-8") as f:
+            trajectory = json.load(f)
+        for name in ARRAY_KEYS:
+            trajectory[name] = np.load(entry / f"{name}.npy", mmap_mode="r")
+
+        # marque l'entrée comme récemment utilisée (LRU)
+        os.utime(meta_path)
+        return trajectory
+
+    def put(self, key: str, trajectory: dict) -> None:
+        """Écrit une entrée de façon atomique puis applique la limite de taille."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.root, prefix=".tmp-"))
+        try:
+            for name in ARRAY_KEYS:
+                np.save(tmp / f"{name}.npy", np.ascontiguousarray(trajectory[name]))
+            with (tmp / "meta.json").open("w", encoding="utf-8") as f:
+                json.dump({"base_antennas": float(trajectory["base_antennas"])}, f)
+            os.replace(tmp, self.root / key)
+        except OSError:
+            # une autre instance a écrit la même entrée entre-temps
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def get_or_render(self, pleasure, arousal, dominance, duration, dt,
+                      motion="yes", yaw_side=1.0) -> dict:
+        """
+        Retourne la trajectoire depuis le cache, ou la calcule et la stocke.
+        Le rendu se fait avec les valeurs PAD quantifiées, pour qu'une
+        entrée en cache soit identique à un nouveau rendu.
+        """
+        key = self.key(pleasure, arousal, dominance, duration, dt, motion, yaw_side)
+        trajectory = self.get(key)
+        if trajectory is not None:
+            self.hits += 1
+            return trajectory
+
+        self.misses += 1
+        pleasure, arousal, dominance = (self.quantize(v) for v in (pleasure, arousal, dominance))
+        trajectory = render_trajectory(pleasure, arousal, dominance, duration, dt,
+                                       motion=motion, yaw_side=yaw_side)
+        self.put(key, trajectory)
+        return trajectory
+
+    # --- éviction LRU ---
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for entry in self.root.iterdir():
+            meta_path = entry / "meta.json"
+            if entry.name.startswith(".") or not meta_path.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((meta_path.stat().st_mtime, size, entry))
+        return entries
+
+    def size(self) -> int:
+        """Taille totale du cache (octets)."""
+        if not self.root.exists():
+            return 0
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Supprime les entrées les plus anciennes tant que le cache dépasse max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
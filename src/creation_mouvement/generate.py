@@ -1,14 +1,30 @@
-from creation_mouvement.robot_config_space.pose_generation import generate_pose
-from creation_mouvement.sound.sound_generation import generate_sound
+from creation_mouvement.pipeline import AudioStreamer, SegmentPipeline
+from creation_mouvement.sound.sound_cache import SoundCache
 
-import json
-import os
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
+import argparse
+from emotion_registry import CREATION_TABLE, load_registry
+from reachy_local import BACKENDS, connect
 
-def main():
 
-    with ReachyMini() as reachy:
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Pose and sound generation from an emotion.")
+    parser.add_argument("--backend", choices=BACKENDS, default="robot",
+                        help="real robot (default) or local simulated stand-in, without daemon")
+    parser.add_argument("--prefetch", type=int, default=2,
+                        help="number of segments (pose + sound) generated ahead of the current one")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=True,
+                        help="synthesize and push the sound block by block while it plays (default)")
+    parser.add_argument("--sound-variants", type=int, default=0,
+                        help="reuse N seeded sounds per emotion and duration from a cache (default 0: always a new sound)")
+    parser.add_argument("--sound-cache-dir",
+                        help="directory where sounds evicted from the in-memory cache are spilled")
+    args = parser.parse_args(argv)
+
+    emotions = load_registry(CREATION_TABLE)
+    sound_cache = SoundCache(spill_dir=args.sound_cache_dir) if args.sound_variants > 0 else None
+
+    with connect(args.backend) as reachy:
 
         print("Hello! Try different emotions here.\nType 'q' and enter if you want to quit.")
 
@@ -17,62 +33,44 @@ def main():
             # 1. Emotionnal state choice
             emotion = input("\nWhich emotion would you like to try? ").strip().lower()
             if emotion == "q":
+                if sound_cache is not None:
+                    print(f"\nSound cache: {sound_cache.stats()}")
                 print("\nQuitting.\n")
                 break
 
             duration_min = float(input("Indicate a minimum duration (seconds): "))
 
-            # 2. PAD loading
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(current_dir, "emotional_space", "pad.json")
+            # 2. PAD lookup (table loaded once, reloaded if pad.json changes)
+            pad = emotions.get(emotion)
+            if pad is None:
+                print(f"\nEmotion '{emotion}' unknown. Available: {', '.join(emotions.names())}")
+                continue
 
-            with open(json_path) as f:
-                pad_data = json.load(f)
+            P, A, D = pad
 
-            if emotion not in pad_data["emotions"]:
-                print(f"\nEmotion '{emotion}' unknown.")
-                return
+            # 3. Pose and sound preparation (generated ahead, in the background)
+            reachy.media.start_playing()
 
-            P = pad_data["emotions"][emotion]["P"]
-            A = pad_data["emotions"][emotion]["A"]
-            D = pad_data["emotions"][emotion]["D"]
+            with SegmentPipeline(P, A, D, duration_min, depth=args.prefetch, stream=args.stream,
+                                 sound_cache=sound_cache, variants=args.sound_variants) as segments, \
+                    AudioStreamer(reachy.media) as audio:
 
-            # 3. Pose and sound preparation
-            duration = 0
-            reachy.media.start_playing()
+                for pose, head, sound in segments:
+
+                    # 4. Pose and sound (already generated, or streamed block by block)
+                    print(f"\nGenerated pose for {emotion}: {pose}")
+                    audio.play(sound)
+
+                    # 5. Execution
+                    reachy.goto_target(
+                        head=head,
+                        antennas=pose["antennas"],
+                        duration=pose["duration"],
+                        method=pose["method"],
+                        body_yaw=pose["body_yaw"]
+                    )
 
-            while (duration <= duration_min):
-
-                # 4. Pose and sound generation
-                pose = generate_pose(P, A, D)
-                print(f"\nGenerated pose for {emotion}: {pose}")
-                sound = generate_sound(P, A, D, pose["duration"])
-
-                reachy.media.push_audio_sample(sound)
-
-                duration+=pose["duration"]
-
-                # 5. Execution
-                
-                head = create_head_pose(
-                    x=pose["x"],
-                    y=pose["y"],
-                    z=pose["z"],
-                    roll=pose["roll"],
-                    pitch=pose["pitch"],
-                    yaw=pose["yaw"],
-                    mm=True,
-                    degrees=True,
-                )
-                reachy.goto_target(
-                    head=head,
-                    antennas=pose["antennas"],
-                    duration=pose["duration"],
-                    method=pose["method"],
-                    body_yaw=pose["body_yaw"]
-                )
-
-                print("The body yaw is of:" + str(pose["body_yaw"]))
+                    print("The body yaw is of:" + str(pose["body_yaw"]))
 
 
 if __name__ == "__main__":
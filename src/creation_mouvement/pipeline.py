@@ -0,0 +1,157 @@
+import queue
+import random
+import threading
+
+from creation_mouvement.robot_config_space.pose_generation import generate_pose
+from creation_mouvement.sound.sound_generation import generate_sound, generate_sound_stream
+
+try:
+    from reachy_mini.utils import create_head_pose
+except ImportError:
+    # No SDK installed (local benchmark backend): same convention
+    from reachy_local import create_head_pose
+
+
+def make_segment(P, A, D, stream=False, sound_cache=None, variants=1):
+    """
+    Generate one segment: pose dict, 4x4 head pose and its sound.
+    With stream=True the sound is a generator of blocks, synthesized while
+    it is played (see AudioStreamer), instead of a full buffer.
+    With a SoundCache, the sound is one of `variants` seeded renderings,
+    served from the cache when the same emotion comes back.
+    """
+    pose = generate_pose(P, A, D)
+    head = create_head_pose(
+        x=pose["x"],
+        y=pose["y"],
+        z=pose["z"],
+        roll=pose["roll"],
+        pitch=pose["pitch"],
+        yaw=pose["yaw"],
+        mm=True,
+        degrees=True,
+    )
+    if sound_cache is not None:
+        sound = sound_cache.get_or_render(P, A, D, pose["duration"], seed=random.randrange(variants))
+    elif stream:
+        sound = generate_sound_stream(P, A, D, pose["duration"])
+    else:
+        sound = generate_sound(P, A, D, pose["duration"])
+    return pose, head, sound
+
+
+class SegmentPipeline:
+    """
+    Background producer of (pose, head, sound) segments for one emotion.
+
+    A worker thread keeps up to `depth` segments ready in a bounded queue
+    while the current one is executed, so that the synthesis cost is hidden
+    behind motion time. Segments are produced until their cumulated duration
+    exceeds `duration_min`, as in the original sequential loop.
+
+    Iterate over the pipeline to consume segments; use it as a context
+    manager (or call close()) to stop the worker early.
+    """
+
+    _DONE = object()
+
+    def __init__(self, P, A, D, duration_min, depth=2, stream=False, sound_cache=None, variants=1):
+        self.P, self.A, self.D = P, A, D
+        self.stream = stream
+        self.sound_cache = sound_cache
+        self.variants = variants
+        self.duration_min = duration_min
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        # put with timeout, so that close() is never blocked by a full queue
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        duration = 0
+        try:
+            while duration <= self.duration_min and not self._stop.is_set():
+                segment = make_segment(self.P, self.A, self.D, self.stream,
+                                       self.sound_cache, self.variants)
+                if not self._put(segment):
+                    return
+                duration += segment[0]["duration"]
+        except Exception as e:
+            # re-raised in the consumer thread
+            self._error = e
+        self._put(self._DONE)
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AudioStreamer:
+    """
+    Pushes sounds to reachy.media from a background thread.
+
+    play() accepts a full buffer or an iterable of blocks (generate_sound_stream):
+    blocks are pushed as soon as they are synthesized, so playback starts
+    after the first block while the rest is rendered during the motion.
+    """
+
+    def __init__(self, media):
+        self.media = media
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while (sound := self._queue.get()) is not None:
+            try:
+                if hasattr(sound, "shape"):
+                    self.media.push_audio_sample(sound)
+                else:
+                    for block in sound:
+                        self.media.push_audio_sample(block)
+            except Exception as e:
+                # re-raised in the caller's thread by close()
+                self._error = e
+                return
+
+    def play(self, sound):
+        self._queue.put(sound)
+
+    def close(self):
+        """Wait until every queued sound has been pushed."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
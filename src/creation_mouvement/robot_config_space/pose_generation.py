@@ -4,6 +4,10 @@ import math
 import time
 from pathlib import Path
 
+import numpy as np
+
+from creation_mouvement.robot_config_space.reachability import reachability_index
+
 # === PARAMETERS ===
 
 # Prismatic values (mm)
@@ -28,6 +32,9 @@ _ant_noise = [0.0, 0.0]
 # Other
 MIN_DURATION = 0.4   # Rapid movement
 MAX_DURATION = 3.0   # Slow movement
+
+# Reachability (see reachability.py)
+MAX_ATTEMPTS = 20    # Draws before projecting onto the nearest reachable pose
 # ==================
 
 RULES_FILE = Path(__file__).parent / "rules" / "rules_2.json"
@@ -64,7 +71,6 @@ def moving_antennas(P, A, D, t=None):
     # --- Base direction ---
     # Higher pleasure => antennas go up
     base_angle = ANT_BOTTOM - 1.1 * P * (ANT_BOTTOM - ANT_TOP)
-    print("\nbase = ", base_angle)
 
     # --- Non-symmetry condition ---
     # Weak dominance and a bit of arousal means confusion => non-symmetry
@@ -72,8 +78,6 @@ def moving_antennas(P, A, D, t=None):
 
     # --- Base movement ---
     ant0 = base_angle + 0.2 * random.uniform(-A * math.pi, A * math.pi) 
-    print("base + osc = ", ant0)
-    print(" ")
     ant1 = ant0 if non_symmetric else - (ant0 - ANT_TOP)
 
     # --- Slow random drift (arousal and dominance-dependent) ---
@@ -93,7 +97,28 @@ def moving_antennas(P, A, D, t=None):
     ]
 
 
-def sample_pose():
+def reachable_pose(draw, max_attempts=MAX_ATTEMPTS, bounds=None):
+    """
+    Rejection sampling: call draw() until the reachability index accepts the pose.
+    After max_attempts rejections, the last pose is projected onto the nearest
+    reachable one (within bounds). max_attempts=0 disables the check.
+    """
+    if not max_attempts:
+        return draw()
+    index = reachability_index()
+    for _ in range(max_attempts):
+        pose = draw()
+        if index.is_reachable(pose):
+            return pose
+    return index.project(pose, bounds)
+
+
+def sample_pose(max_attempts=MAX_ATTEMPTS):
+    bounds = {"roll": (-30, 30), "pitch": (-30, 30), "yaw": (-45, 45)}
+    return reachable_pose(_sample_pose, max_attempts, bounds)
+
+
+def _sample_pose():
     x = rint(-40, 40)
     y = rint(-60, 60)
     z = rint(-60, 60)
@@ -118,8 +143,28 @@ def sample_pose():
     }
 
 
-def generate_pose(P, A, D):
-    """Convert PAD coordinates (from 0 to 1) into a robot pose."""
+def generate_pose(P, A, D, max_attempts=MAX_ATTEMPTS):
+    """Convert PAD coordinates (from 0 to 1) into a reachable robot pose."""
+    bounds = {
+        "roll": (-MAX_ROLL, MAX_ROLL),
+        "pitch": (-abs(MIN_PITCH), MAX_PITCH),
+        "yaw": (-MAX_YAW, MAX_YAW),
+    }
+    # rejection and projection only see the head: the antenna drift
+    # (a random walk) advances once per returned pose, as without the check
+    pose = reachable_pose(lambda: _generate_head(P, A, D), max_attempts, bounds)
+    return _with_antennas(pose, moving_antennas(P, A, D))
+
+
+def _with_antennas(pose, antennas):
+    """Pose dict with its antennas, fields in the order of the original generate_pose."""
+    fields = ("x", "y", "z", "roll", "pitch", "yaw")
+    return {**{k: pose[k] for k in fields}, "antennas": antennas,
+            **{k: v for k, v in pose.items() if k not in fields}}
+
+
+def _generate_head(P, A, D):
+    """Head, body and timing fields of a robot pose for PAD coordinates (one draw, unchecked, no antennas)."""
 
     # --- PAD center (neutral) ---
     x_c = 0
@@ -180,8 +225,142 @@ def generate_pose(P, A, D):
         "roll": roll,
         "pitch": pitch,
         "yaw": yaw,
-        "antennas": moving_antennas(P, A, D),
         "duration": round(duration, 2),
         "method": method,
         "body_yaw": round(body_yaw, 2),
     }
+
+
+# === BATCH SAMPLING ===
+
+# One row per pose, same fields as the dict returned by generate_pose
+# (the method is always "minjerk", see POSE_METHOD)
+POSE_DTYPE = np.dtype([
+    ("x", np.int64),
+    ("y", np.int64),
+    ("z", np.float64),
+    ("roll", np.int64),
+    ("pitch", np.int64),
+    ("yaw", np.int64),
+    ("antennas", np.float64, (2,)),
+    ("duration", np.float64),
+    ("body_yaw", np.float64),
+])
+POSE_METHOD = "minjerk"
+
+
+def _uniform_noise(rng, sigma, k, n):
+    """Vectorized noise(sigma, k)."""
+    return rng.uniform(-k * sigma, k * sigma, n)
+
+
+def _antennas_batch(P, A, D, n, rng):
+    """
+    moving_antennas for n consecutive calls.
+    The drift is a clamped random walk, integrated step by step
+    (starting from zero, the module-level drift state is not used).
+    """
+    base_angle = ANT_BOTTOM - 1.1 * P * (ANT_BOTTOM - ANT_TOP)
+    non_symmetric = D < 0.6 and A > 0.3
+
+    ant = np.empty((n, 2))
+    ant[:, 0] = base_angle + 0.2 * rng.uniform(-A * math.pi, A * math.pi, n)
+    ant[:, 1] = ant[:, 0] if non_symmetric else -(ant[:, 0] - ANT_TOP)
+
+    drift_step = 0.1 * A * (1/D)
+    drift_limit = 2 * drift_step
+    steps = rng.uniform(-drift_step, drift_step, (n, 2))
+
+    drift = np.empty((n, 2))
+    for i in (0, 1):
+        values = []
+        append = values.append
+        value = 0.0
+        for step in steps[:, i].tolist():
+            value += step
+            if value > drift_limit:
+                value = drift_limit
+            elif value < -drift_limit:
+                value = -drift_limit
+            append(value)
+        drift[:, i] = values
+
+    return np.round((ant + drift) % (2 * math.pi), 2)
+
+
+def generate_poses(P, A, D, n, rng=None):
+    """
+    Batch version of generate_pose: n poses as a structured array (POSE_DTYPE),
+    drawn from a numpy Generator (seeded for reproducible pose banks).
+    Same distributions and safety clamps as generate_pose.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    elif not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+
+    def randint(a, b):
+        # random.randint: both bounds included
+        return rng.integers(a, b, size=n, endpoint=True)
+
+    # --- Position (x, y, z) according to Arousal and Dominance ---
+    x = randint(int(-abs(MIN_X)*(A)), int(MAX_X*A))
+    y = randint(int(-MAX_Y*A), int(MAX_Y*A))
+    z = D * randint(int(-MAX_Z*(1 - D)), int(MAX_Z*D))
+
+    # --- Apply existing rules for head orientation ---
+    roll_r  = RULES["roll_from_y"]
+    pitch_r = RULES["pitch_from_z"]
+    yaw_r   = RULES["yaw_from_x"]
+
+    roll  = roll_r["a"]  * y + roll_r["b"]  + _uniform_noise(rng, roll_r["sigma"], 0.5, n)
+    pitch = pitch_r["a"] * z + pitch_r["b"] + _uniform_noise(rng, pitch_r["sigma"], 0.5, n)
+    yaw   = yaw_r["a"]   * x + yaw_r["b"]   + _uniform_noise(rng, yaw_r["sigma"], 0.5, n)
+
+    # --- Orientation amplified with Aroussal ---
+    roll *= A
+    yaw  *= A
+
+    pitch -= 1.5 * (2 * P - 1) * np.abs(randint(MIN_PITCH, -MIN_PITCH))
+    pitch *= A
+
+    # --- Body yaw (bounds depend on each sample's yaw) ---
+    body_amp = np.abs(0.2 * A * yaw)
+    body_yaw = rng.integers(-body_amp.astype(np.int64), body_amp.astype(np.int64), endpoint=True)
+
+    # --- Dominance influence ---
+    body_yaw = body_yaw * (1/D)
+    yaw *= 1/D
+
+    # --- Duration ---
+    duration = MIN_DURATION + (1 - A) * (MAX_DURATION - MIN_DURATION)
+    duration = duration * (1 + rng.uniform(-0.5, 0.5, n) * A)
+
+    # --- Safety clamps (int() truncates toward zero) ---
+    poses = np.empty(n, dtype=POSE_DTYPE)
+    poses["x"] = x
+    poses["y"] = y
+    poses["z"] = z
+    poses["roll"] = np.trunc(np.clip(roll, -MAX_ROLL, MAX_ROLL))
+    poses["pitch"] = np.trunc(np.clip(pitch, -abs(MIN_PITCH), MAX_PITCH))
+    poses["yaw"] = np.trunc(np.clip(yaw, -MAX_YAW, MAX_YAW))
+    poses["antennas"] = _antennas_batch(P, A, D, n, rng)
+    poses["duration"] = np.round(np.clip(duration, MIN_DURATION, MAX_DURATION), 2)
+    poses["body_yaw"] = np.round(np.clip(body_yaw, -MAX_BODY_YAW, MAX_BODY_YAW), 2)
+    return poses
+
+
+def pose_dict(record):
+    """One row of generate_poses as the dict returned by generate_pose."""
+    return {
+        "x": int(record["x"]),
+        "y": int(record["y"]),
+        "z": float(record["z"]),
+        "roll": int(record["roll"]),
+        "pitch": int(record["pitch"]),
+        "yaw": int(record["yaw"]),
+        "antennas": record["antennas"].tolist(),
+        "duration": float(record["duration"]),
+        "method": POSE_METHOD,
+        "body_yaw": float(record["body_yaw"]),
+    }
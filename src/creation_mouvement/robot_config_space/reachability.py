@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Labelled poses collected with robot_space_limit_testing.py (label 1 = reachable)
+DATASETS = sorted((Path(__file__).parent / "pose_datasets").glob("pose_dataset_*.json"))
+
+FEATURES = ("x", "y", "z", "roll", "pitch", "yaw")
+
+
+def load_samples(paths=DATASETS):
+    """
+    Read the labelled poses of the datasets as (X, labels), X of shape (n, 6).
+    The datasets overlap: a pose present in several files is kept once,
+    with the label of the last file.
+    """
+    samples = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for d in json.load(f):
+                p = d["pose"]
+                samples[tuple(float(p[k]) for k in FEATURES)] = int(d["label"])
+    X = np.array(list(samples), dtype=float).reshape(-1, len(FEATURES))
+    labels = np.array(list(samples.values()), dtype=float)
+    return X, labels
+
+
+def _as_array(poses):
+    """Pose dict, structured array (generate_poses) or (..., 6) array → (n, 6) float array."""
+    if isinstance(poses, dict):
+        return np.array([[poses[k] for k in FEATURES]], dtype=float)
+    poses = np.asarray(poses)
+    if poses.dtype.names is not None:
+        return np.stack([poses[k] for k in FEATURES], axis=-1).astype(float).reshape(-1, len(FEATURES))
+    return poses.astype(float).reshape(-1, len(FEATURES))
+
+
+class ReachabilityIndex:
+    """
+    k-nearest-neighbours reachability classifier over (x, y, z, roll, pitch, yaw).
+
+    Each axis is normalized by the extent of the datasets so that mm and degrees
+    weigh the same. probability() is the fraction of reachable poses among
+    the k nearest labelled ones (O(log n) per query with a KD-tree).
+    Leave-one-out accuracy on the current datasets is about 79 % with k = 7.
+
+    Projection uses only "confident" reachable samples: poses labelled 1
+    whose own neighbourhood is also classified reachable.
+    """
+
+    def __init__(self, paths=DATASETS, k=7, threshold=0.5):
+        X, labels = load_samples(paths)
+        self.k = min(k, len(X))
+        self.threshold = threshold
+        self.scale = np.abs(X).max(axis=0)
+        self.scale[self.scale == 0] = 1.0
+        self.labels = labels
+        self.tree = cKDTree(X / self.scale)
+
+        # confident reachable poses, targets of project()
+        confident = (labels == 1) & (self.probability(X) >= threshold)
+        self.reachable = X[confident]
+        self.reachable_tree = cKDTree(self.reachable / self.scale)
+
+    def probability(self, poses) -> np.ndarray:
+        """Estimated probability that each pose is reachable, shape (n,)."""
+        _, idx = self.tree.query(_as_array(poses) / self.scale, k=self.k)
+        return self.labels[idx.reshape(len(idx), -1)].mean(axis=1)
+
+    def is_reachable(self, pose) -> bool:
+        return bool(self.probability(pose)[0] >= self.threshold)
+
+    def project(self, pose: dict, bounds: dict | None = None, candidates: int = 32) -> dict:
+        """
+        Copy of the pose with (x, y, z, roll, pitch, yaw) replaced by the nearest
+        confident reachable pose. With bounds ({feature: (min, max)}), the nearest
+        of the `candidates` closest ones inside the bounds is used, and the result
+        is clamped to them if none is.
+        """
+        _, idx = self.reachable_tree.query(_as_array(pose)[0] / self.scale,
+                                           k=min(candidates, len(self.reachable)))
+        idx = np.atleast_1d(idx)
+        target = self.reachable[idx[0]]
+        if bounds:
+            for i in idx:
+                if all(lo <= self.reachable[i][FEATURES.index(k)] <= hi for k, (lo, hi) in bounds.items()):
+                    target = self.reachable[i]
+                    break
+
+        projected = dict(pose)
+        for k, v in zip(FEATURES, target):
+            if bounds and k in bounds:
+                v = max(bounds[k][0], min(bounds[k][1], v))
+            projected[k] = int(v)
+        return projected
+
+
+_index = None
+
+
+def reachability_index() -> ReachabilityIndex:
+    """Shared index, built from the datasets on first use."""
+    global _index
+    if _index is None:
+        _index = ReachabilityIndex()
+    return _index
@@ -1,9 +1,20 @@
+import argparse
 import json
 import random
+import sys
 from pathlib import Path
 
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
+# src/ folder: shared modules (reachy_local, ...)
+SRC_DIR = Path(__file__).resolve().parents[2]
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+
+from reachy_local import BACKENDS, connect
+
+try:
+    from reachy_mini.utils import create_head_pose
+except ImportError:
+    from reachy_local import create_head_pose
 
 # ========= PARAMÈTRES =========
 N_SAMPLES = 10         # nombre de tests à faire
@@ -89,14 +100,14 @@ def ask_user():
             return None
 
 
-def main():
+def main(backend="robot"):
     dataset = []
 
     print(f"Début de la collecte ({N_SAMPLES} poses max)")
     print("Regarde la simu, puis tape 1 / 0")
     print("-" * 50)
 
-    with ReachyMini() as reachy:
+    with connect(backend) as reachy:
         for i in range(N_SAMPLES):
             pose = sample_pose()
 
@@ -149,4 +160,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKENDS, default="robot")
+    main(parser.parse_args().backend)
@@ -0,0 +1,204 @@
+"""Batch rendering of emotion sounds to audio files, across all cores.
+
+Run from src/:
+    python -m creation_mouvement.sound.batch_render --out sounds --emotion all --variants 8 --durations 1 2 3
+    python -m creation_mouvement.sound.batch_render --out sounds --jobs jobs.json --format flac
+
+A jobs file is a JSON list of {"emotion": "joy" | "pad": [P, A, D], "duration": s, "seed": n}.
+Every sound is rendered with generate_sound(..., rng=seed), so a job always
+gives the same file. A manifest.json in the output directory records the
+parameters of each file; rerunning skips the files already present with
+matching parameters (and the same synthesis code), so an interrupted batch
+resumes where it stopped.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import wave
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+
+from creation_mouvement.sound.sound_cache import code_version
+from creation_mouvement.sound.sound_generation import SAMPLE_RATE, generate_sound
+from emotion_registry import CREATION_TABLE, load_registry
+
+FORMATS = {"wav16": "wav", "wav32f": "wav", "flac": "flac"}
+MANIFEST = "manifest.json"
+
+
+def make_jobs(emotions, durations, variants, first_seed=0) -> list[dict]:
+    """One job per (emotion, duration, seed) combination."""
+    return [
+        {"emotion": emotion, "duration": float(duration), "seed": first_seed + seed}
+        for emotion in emotions
+        for duration in durations
+        for seed in range(variants)
+    ]
+
+
+def resolve(job: dict, registry) -> dict:
+    """Job with its PAD values, file name and format filled in."""
+    if "pad" in job:
+        P, A, D = (float(v) for v in job["pad"])
+        label = "pad"
+    else:
+        pad = registry.get(job["emotion"])
+        if pad is None:
+            raise ValueError(f"Unknown emotion: {job['emotion']} (available: {registry.names()})")
+        P, A, D = pad
+        label = job["emotion"]
+
+    params = {
+        "emotion": job.get("emotion"),
+        "pad": [P, A, D],
+        "duration": float(job["duration"]),
+        "seed": int(job["seed"]),
+        "format": job["format"],
+        "code": code_version(),
+    }
+    digest = hashlib.sha1(json.dumps([params["pad"], params["duration"], params["seed"]]).encode()).hexdigest()[:10]
+    params["file"] = f"{label}_{params['duration']:g}s_seed{params['seed']}_{digest}.{FORMATS[job['format']]}"
+    return params
+
+
+def write_audio(path: Path, sound: np.ndarray, fmt: str) -> None:
+    """Write a float32 buffer: 16-bit PCM WAV (stdlib), float32 WAV or FLAC (soundfile)."""
+    tmp = path.with_name(f".tmp-{os.getpid()}-{path.name}")     # one per worker
+    if fmt == "wav16":
+        pcm = (np.clip(sound, -1.0, 1.0) * 32767).astype("<i2")
+        with wave.open(str(tmp), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes(pcm.tobytes())
+    else:
+        import soundfile as sf
+        subtype = "FLOAT" if fmt == "wav32f" else "PCM_16"
+        sf.write(str(tmp), sound, SAMPLE_RATE, subtype=subtype, format=FORMATS[fmt].upper())
+    os.replace(tmp, path)
+
+
+def render_job(params: dict, out_dir: str) -> dict:
+    """Worker: render one sound and write its file; returns the manifest entry."""
+    P, A, D = params["pad"]
+    sound = generate_sound(P, A, D, params["duration"], rng=params["seed"])
+    write_audio(Path(out_dir) / params["file"], sound, params["format"])
+    return {**params, "samples": len(sound), "peak": float(np.abs(sound).max(initial=0.0))}
+
+
+def load_manifest(out_dir: Path) -> dict:
+    path = out_dir / MANIFEST
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(out_dir: Path, manifest: dict) -> None:
+    tmp = out_dir / f".tmp-{MANIFEST}"
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, out_dir / MANIFEST)
+
+
+def is_done(params: dict, manifest: dict, out_dir: Path) -> bool:
+    entry = manifest.get(params["file"])
+    if entry is None or not (out_dir / params["file"]).exists():
+        return False
+    return all(entry.get(k) == v for k, v in params.items())
+
+
+def run(jobs: list[dict], out_dir: Path, workers: int | None = None) -> dict:
+    """
+    Render the jobs not already in the manifest; returns counts of rendered/skipped/failed jobs.
+    Failed jobs (invalid or not rendered) are recorded in the manifest with their
+    error, and tried again on the next run.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    registry = load_registry(CREATION_TABLE)
+    manifest = {k: v for k, v in load_manifest(out_dir).items() if "error" not in v}
+
+    todo, files = [], set()
+    skipped = failed = 0
+    for i, job in enumerate(jobs):
+        try:
+            params = resolve(job, registry)
+        except Exception as e:
+            failed += 1
+            manifest[f"invalid-job-{i}"] = {"job": job, "error": f"{type(e).__name__}: {e}"}
+            print(f"  invalid job {i}: {job} ({type(e).__name__}: {e})")
+            continue
+        # same output file = same parameters: rendered once
+        if params["file"] in files or is_done(params, manifest, out_dir):
+            skipped += 1
+            continue
+        files.add(params["file"])
+        todo.append(params)
+    if failed:
+        save_manifest(out_dir, manifest)
+    print(f"{len(jobs)} jobs: {skipped} already rendered or duplicated, {failed} invalid, {len(todo)} to render")
+
+    rendered = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {pool.submit(render_job, params, str(out_dir)): params for params in todo}
+        for future in as_completed(futures):
+            params = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                failed += 1
+                entry = {**params, "error": f"{type(e).__name__}: {e}"}
+                print(f"  failed: {params['file']} ({entry['error']})")
+            else:
+                rendered += 1
+                print(f"  [{rendered}/{len(todo)}] {entry['file']}")
+            manifest[entry["file"]] = entry
+            save_manifest(out_dir, manifest)     # after every file: a crash loses nothing
+
+    return {"rendered": rendered, "skipped": skipped, "failed": failed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render emotion sounds to files on all cores.")
+    parser.add_argument("--out", required=True, help="output directory (manifest.json is kept there)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--jobs", help="JSON list of jobs: {emotion | pad, duration, seed}")
+    source.add_argument("--emotion", nargs="+",
+                        help="emotions of pad.json to render ('all' for every emotion)")
+    parser.add_argument("--durations", nargs="+", type=float, default=[2.0],
+                        help="durations (s) rendered for each emotion (default 2.0)")
+    parser.add_argument("--variants", type=int, default=1,
+                        help="seeds rendered for each emotion and duration (default 1)")
+    parser.add_argument("--first-seed", type=int, default=0, help="first seed of the variants")
+    parser.add_argument("--format", choices=FORMATS, default="wav16",
+                        help="wav16 (default, no dependency), wav32f or flac (need soundfile)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.jobs:
+        with open(args.jobs, "r", encoding="utf-8") as f:
+            jobs = json.load(f)
+    else:
+        emotions = load_registry(CREATION_TABLE).names() if args.emotion == ["all"] else args.emotion
+        jobs = make_jobs(emotions, args.durations, args.variants, args.first_seed)
+    for job in jobs:
+        if isinstance(job, dict):    # anything else is reported as an invalid job by run()
+            job.setdefault("format", args.format)
+            job.setdefault("seed", 0)
+
+    counts = run(jobs, Path(args.out), args.workers)
+    print(f"Done: {counts['rendered']} rendered, {counts['skipped']} skipped, {counts['failed']} failed")
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
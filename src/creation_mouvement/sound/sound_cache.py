@@ -0,0 +1,170 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from creation_mouvement.sound.sound_generation import SAMPLE_RATE, generate_sound
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+FADE_OUT = 0.01     # s, applied when a cached sound is shortened
+
+# Sources the rendering depends on: spilled files from another version are ignored
+_SOURCES = (
+    Path(__file__).parent / "sound_generation.py",
+    *sorted((Path(__file__).resolve().parents[2] / "synth_core").glob("*.py")),
+)
+_code_version = None
+
+
+def code_version() -> str:
+    """Hash of the sound generation code (computed once)."""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha1()
+        for path in _SOURCES:
+            h.update(path.read_bytes())
+        _code_version = h.hexdigest()[:12]
+    return _code_version
+
+
+class SoundCache:
+    """
+    Cache of deterministic generate_sound buffers.
+
+    Entries are keyed by quantized (P, A, D, duration) and the seed, and
+    rendered with the quantized values, so a cached buffer is exactly what
+    a new rendering would give. The returned buffer is then shortened (with
+    a FADE_OUT fade, the release would otherwise be cut), or padded with
+    silence, to the requested duration (int(duration * SAMPLE_RATE)
+    samples, as generate_sound), so the sound never outlasts or stops
+    before the pose it goes with. Buffers are kept in memory in LRU order
+    up to max_bytes; least recently used ones are then dropped, or spilled
+    as .npy files to spill_dir if given (read back with mmap on a later hit).
+    Returned buffers are read-only and shared: copy them before modifying.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, spill_dir: str | Path | None = None,
+                 pad_quantum: float = 0.01, duration_quantum: float = 0.05):
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.pad_quantum = pad_quantum
+        self.duration_quantum = duration_quantum
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # --- statistics ---
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _quantize(value: float, quantum: float) -> float:
+        return round(round(value / quantum) * quantum, 6)
+
+    def key(self, P, A, D, duration, seed) -> tuple:
+        return (
+            *(self._quantize(v, self.pad_quantum) for v in (P, A, D)),
+            self._quantize(duration, self.duration_quantum),
+            int(seed),
+        )
+
+    def _spill_path(self, key) -> Path:
+        name = hashlib.sha1(repr((key, code_version())).encode()).hexdigest()
+        return self.spill_dir / f"{name}.npy"
+
+    @staticmethod
+    def _fit(sound, duration) -> np.ndarray:
+        """Read-only buffer of exactly int(duration * SAMPLE_RATE) samples."""
+        n = int(SAMPLE_RATE * duration)
+        if len(sound) == n:
+            return sound
+        fitted = np.zeros(n, dtype=sound.dtype)
+        if len(sound) > n:
+            fitted[:] = sound[:n]
+            fade = min(int(FADE_OUT * SAMPLE_RATE), n)
+            fitted[n - fade:] *= np.linspace(1.0, 0.0, fade, dtype=sound.dtype)
+        else:
+            fitted[:len(sound)] = sound
+        fitted.setflags(write=False)
+        return fitted
+
+    # --- memory LRU ---
+    def _store(self, key, sound) -> None:
+        self._entries[key] = sound
+        self._bytes += sound.nbytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, old = self._entries.popitem(last=False)
+            self._bytes -= old.nbytes
+            self.evictions += 1
+            if self.spill_dir is not None and not isinstance(old, np.memmap):
+                self._spill(old_key, old)
+
+    def _spill(self, key, sound) -> None:
+        path = self._spill_path(key)
+        if path.exists():
+            return
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.spill_dir, prefix=".tmp-", suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, sound)
+        os.replace(tmp, path)
+
+    def get(self, P, A, D, duration, seed) -> np.ndarray | None:
+        """Cached buffer fitted to duration, None if absent from memory and disk."""
+        sound = self._lookup(self.key(P, A, D, duration, seed))
+        return None if sound is None else self._fit(sound, duration)
+
+    def _lookup(self, key) -> np.ndarray | None:
+        with self._lock:
+            sound = self._entries.get(key)
+            if sound is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sound
+
+            if self.spill_dir is not None:
+                path = self._spill_path(key)
+                if path.exists():
+                    sound = np.load(path, mmap_mode="r")
+                    self._store(key, sound)
+                    self.disk_hits += 1
+                    return sound
+        return None
+
+    def get_or_render(self, P, A, D, duration, seed) -> np.ndarray:
+        """Buffer from the cache, or rendered with the quantized parameters and stored; fitted to duration."""
+        key = self.key(P, A, D, duration, seed)
+        sound = self._lookup(key)
+        if sound is None:
+            sound = generate_sound(*key[:4], rng=key[4])
+            sound.setflags(write=False)
+            with self._lock:
+                self.misses += 1
+                if key not in self._entries:
+                    self._store(key, sound)
+        return self._fit(sound, duration)
+
+    def clear(self) -> None:
+        """Empty the memory part (spilled files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
@@ -1,24 +1,87 @@
 import numpy as np
 import random as rd
+from functools import lru_cache
 from scipy.interpolate import make_interp_spline
 
+from synth_core import OscillatorBank
+
 SAMPLE_RATE = 44100
 PITCH_RANGE = 1.0  # en octaves
 MAX_END = 2
 CONSONANT = np.array([1, 6/5, 5/4, 4/3, 3/2, 5/3, 2])
 DISSONANT = np.array([1, 16/15, 9/8, 7/5, 10/7, 11/8, 13/9])
+BLOCK_SIZE = 441  # 10 ms à 44.1 kHz (mode streaming)
+CONTROL_RATE = 1000  # fréquence des courbes de contrôle de SoundSynth (Hz)
 
 
-def note_curve(P, A, D, t, duration):
+class GlobalRandom:
+    """Tirages sur l'état global de random et np.random (comportement historique)."""
+
+    uniform = staticmethod(rd.uniform)
+    choice = staticmethod(rd.choice)
+    randint = staticmethod(rd.randint)
+    random = staticmethod(rd.random)
+    rand = staticmethod(np.random.rand)
+    randn = staticmethod(np.random.randn)
+
+
+class SeededRandom:
+    """Mêmes tirages que GlobalRandom, sur un np.random.Generator dédié (mode déterministe)."""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def uniform(self, a, b):
+        # comme random.uniform, accepte b < a (ex. uniform(0, A) avec A < 0),
+        # que Generator.uniform refuse ; mêmes valeurs sinon
+        return a + (b - a) * float(self.rng.random())
+
+    def choice(self, seq):
+        return seq[self.rng.integers(len(seq))]
+
+    def randint(self, a, b):
+        return int(self.rng.integers(a, b, endpoint=True))
+
+    def random(self):
+        return float(self.rng.random())
+
+    def rand(self, n):
+        return self.rng.random(n)
+
+    def randn(self, n):
+        return self.rng.standard_normal(n)
+
+
+GLOBAL_RANDOM = GlobalRandom()
+
+
+def random_source(rng=None):
+    """
+    Source des tirages : état global si rng est None, sinon un
+    np.random.Generator ou une graine (entier) pour un son reproductible.
+    """
+    if rng is None:
+        return GLOBAL_RANDOM
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    return SeededRandom(rng)
+
+
+def _ramp(i, count):
+    """Valeurs de np.linspace(0, 1, count) aux indices i."""
+    return i / (count - 1) if count > 1 else np.zeros(np.shape(i))
+
+
+def note_plan(P, A, D, n, duration, random=GLOBAL_RANDOM):
+    """Tirages aléatoires de note_curve (notes, durées, glide), sans évaluation."""
     # nombre de notes
-    n = len(t)
     n_notes = int(2 + 10 * A * (1-D))
     
     # durées
     if D > 0.5:
         durations = np.ones(n_notes)
     else:
-        durations = np.random.rand(n_notes)
+        durations = random.rand(n_notes)
     durations = durations / durations.sum() * duration
 
     # hauteurs
@@ -27,52 +90,70 @@ def note_curve(P, A, D, t, duration):
     current = 0.0
 
     for _ in range(n_notes):
-        r = rd.choice(ratios)
-        jitter = rd.uniform(-0.03, 0.03) * (1 - D)
+        r = random.choice(ratios)
+        jitter = random.uniform(-0.03, 0.03) * (1 - D)
         current += np.log2(r) + jitter
         notes.append(current)
 
-    curve = np.zeros(n)
-    idx = 0
-
     # durée du glide (en samples)
     glide_time = (1 - D) * 0.05 + 0.002   # 2ms → 50ms
     glide_n = int(glide_time * SAMPLE_RATE)
 
-    prev = notes[0]
+    # bornes des notes (en samples) : les notes pavent exactement [0, n)
+    bounds = np.round(np.cumsum(durations) / duration * n).astype(np.int64)
+    bounds[-1] = n
+    starts = np.concatenate([[0], bounds[:-1]])
+
+    return {
+        "notes": np.array(notes),
+        "starts": starts,
+        "ends": bounds,
+        "glide": _glide_kernel(glide_n),
+    }
 
-    for dur, val in zip(durations, notes):
-        seg_n = int(dur / duration * n)
-        seg_n = max(seg_n, glide_n + 1)
 
-        # partie stable
-        curve[idx:idx+seg_n] = val
+@lru_cache(maxsize=64)
+def _glide_kernel(glide_n):
+    """Forme du glide entre deux notes, interpolation non linéaire (plus nerveux)."""
+    glide = np.linspace(0, 1, glide_n) ** 1.5
+    glide.setflags(write=False)
+    return glide
 
-        # transition depuis la note précédente
-        if idx > 0 and glide_n > 1:
-            g = np.linspace(0, 1, glide_n)
-            # interpolation non linéaire (plus nerveux)
-            g = g**1.5
-            curve[idx:idx+glide_n] = prev + g * (val - prev)
 
-        prev = val
-        idx += seg_n
+def note_at(plan, i):
+    """Courbe de notes en des positions quelconques i (samples, éventuellement fractionnaires)."""
+    notes, starts, ends, glide = plan["notes"], plan["starts"], plan["ends"], plan["glide"]
+
+    k = np.clip(np.searchsorted(starts, i, side="right") - 1, 0, len(notes) - 1)
+    curve = notes[k]
+
+    # transition depuis la note précédente
+    if len(glide) > 1:
+        offset = i - starts[k]
+        g = (k > 0) & (offset < np.minimum(len(glide), ends[k] - starts[k]))
+        kg = k[g]
+        shape = np.interp(offset[g], np.arange(len(glide)), glide)
+        curve[g] = notes[kg - 1] + shape * (notes[kg] - notes[kg - 1])
 
-    curve[idx:] = prev
     return curve
 
 
+def note_curve(P, A, D, t, duration):
+    n = len(t)
+    return note_at(note_plan(P, A, D, n, duration), np.arange(n))
 
-def pitch_curve(P, A, D, t, duration):
+
+def pitch_plan(P, A, D, duration, random=GLOBAL_RANDOM):
+    """Tirages aléatoires de pitch_curve (spline et vibrato), sans évaluation."""
     start = 0.0
     
     # --- nombre de segments intermédiaires selon D ---
-    n_mid = rd.randint(1, max(1, int(10 * A)))
+    n_mid = random.randint(1, max(1, int(10 * A)))
     mid_points = [start]
     sign = 1  # la première pente va vers le haut
     for i in range(n_mid):
         # force de la pente dépend de A
-        strength = A * rd.uniform(0.5, 1.0)
+        strength = A * random.uniform(0.5, 1.0)
         # on flip le signe à chaque segment
         sign *= -1
         mid_val = mid_points[-1] + sign * strength
@@ -81,102 +162,192 @@ def pitch_curve(P, A, D, t, duration):
     # --- end point ---
     gravity = (1 - D) * (1 - P)
     end_sign = 1 if P > 0.5 else -1
-    end = end_sign * gravity * MAX_END * (0.5 + rd.random())
+    end = end_sign * gravity * MAX_END * (0.5 + random.random())
     mid_points.append(end)
     
     # --- temps clé avec durées aléatoires ---
-    durations = np.random.rand(len(mid_points)-1)  # génère des valeurs aléatoires pour chaque segment
+    durations = random.rand(len(mid_points)-1)  # génère des valeurs aléatoires pour chaque segment
     durations = durations / durations.sum() * duration  # normalise pour que la somme = duration totale
     key_times = np.cumsum([0] + list(durations))  # cumul pour avoir les temps de chaque point
     
     key_values = np.array(mid_points)
     
-    # --- beta-spline ---
-    spline = make_interp_spline(key_times, key_values, k=2)
-    curve = spline(t)
-    
     # --- vibrato ---
     vib_freq = 3 + (1-D) * 10
     vib_freq *= (0.7 + 0.6 * (1 - D))
     vib_amp = 0.15 * A * (1 - D)
-    vibrato = vib_amp * np.sin(2 * np.pi * vib_freq * t)
-    
-    return curve + vibrato
-
-
-def generate_sound(P, A, D, duration):
-    sr = SAMPLE_RATE
-    n = int(sr * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
-
-    f0 = 220 + 440 * A * rd.uniform(0, A)  # base pitch
-
-    C_cont = pitch_curve(P, A, D, t, duration)
-    C_note = note_curve(P, A, D, t, duration)
-
-    # dominance = morph
-    C = (1 - D) * C_cont + D * C_note
-
-    # fréquence instantanée
-    f = f0 * (2 ** C)
-
-    # intégration de phase
-    phase = 2 * np.pi * np.cumsum(f) / sr
-
-    # oscillateurs
-    signal = np.sin(phase)
-    num_harmonics = int(2 + 10 * A)
 
-    for k in range(2, 2 + num_harmonics):
-        amp = 1 / k
-        # écart entre harmoniques pour un timbre plus naturel
-        # P proche de 1 → ratios stables (plaisir)
-        # P faible → ratios légèrement décalés (mineur / sombre)
-        # base_ratio = k if P > 0.5 else k * rd.uniform(-0.3, 0.3)
-        inharm = (1 - P) * rd.uniform(-0.15, 0.15)
-        freq_ratio = k * (1 + inharm)
+    return {
+        # --- beta-spline ---
+        "spline": make_interp_spline(key_times, key_values, k=2),
+        "vib_freq": vib_freq,
+        "vib_amp": vib_amp,
+    }
 
-        
-        # Arousal → ajouter un petit random pour rendre la voix moins robotique
-        freq_ratio = freq_ratio + rd.uniform(-0.07, 0.07) * A
 
-        signal += amp * np.sin(k * freq_ratio * phase)
+def pitch_at(plan, t):
+    """Courbe de hauteur continue (spline + vibrato) aux instants t, évaluée exactement."""
+    vibrato = plan["vib_amp"] * np.sin(2 * np.pi * plan["vib_freq"] * t)
+    return plan["spline"](t) + vibrato
 
-    # bruit
-    noise = (0.08 + 0.1 * A * (1 - D)) * np.random.randn(n)
-
-    # gain selon Dominance
-    gain = 0.2 + 0.8 * D
-
-    # --- enveloppe ---
-    env = np.ones(n)
-
-    # attaque dépendante de l'arousal
-    attack_time = 0.2 + (1 - A + 0.01) * 0.5
-    attack_n = int(sr * attack_time)
-    attack_n = min(attack_n, n // 2)
-
-    env[:attack_n] = np.linspace(0, 1, attack_n)
-
-    # Sustain
-    env[attack_n:] = 1.0
-    sustain_level = 0.6 + 0.4 * D
-    env *= sustain_level
-
-    # montée progressive sur toute la durée
-    env *= np.linspace(0.2, 1.0, n)
-
-    # release doux
-    release_ratio = 0.3 + 0.4 * (1 - A)
-    release_n = int(release_ratio * n)
-    release_n = min(release_n, n - attack_n)
-
-    env[-release_n:] *= np.linspace(1, 0, release_n)
-
-    r = np.linspace(0, 1, release_n)
-    env[-release_n:] *= np.exp(-4.5 * r)
-
-    out = gain * env * (signal + noise)
-    
-    return out.astype(np.float32)
 
+def pitch_curve(P, A, D, t, duration):
+    return pitch_at(pitch_plan(P, A, D, duration), t)
+
+
+class SoundSynth:
+    """
+    Synthèse d'un son émotionnel par blocs.
+
+    Tous les tirages aléatoires (hauteur de base, courbes, harmoniques) sont
+    faits à la construction, dans le même ordre que l'ancien generate_sound ;
+    render() produit ensuite les samples suivants en reportant d'un bloc à
+    l'autre la phase intégrée et la position dans l'enveloppe. Le bruit est
+    tiré bloc par bloc.
+
+    Les courbes de contrôle (hauteur, notes, enveloppe), limitées à quelques
+    dizaines de Hz, sont calculées à control_rate (grille fixe) ; seules la
+    fréquence instantanée et l'enveloppe sont interpolées à la fréquence audio,
+    pour les oscillateurs. control_rate=None : tout est calculé par sample.
+
+    Le son à control_rate n'est pas identique, sample à sample, à celui de
+    control_rate=None : la fréquence interpolée reste à moins de 0.2 cent
+    pour 99 % des samples (l'écart n'est grand que sur la ms qui lisse un
+    saut de note), mais ces petits écarts s'intègrent dans la phase, et
+    les partiels élevés (multiplicateurs jusqu'à ~170) les amplifient. Les
+    formes d'onde se décalent donc au fil du son (écart max mesuré jusqu'à
+    ~40 % du pic sur 3 s) ; le contenu spectral et la hauteur perçue sont
+    les mêmes.
+    """
+
+    def __init__(self, P, A, D, duration, rng=None, control_rate=CONTROL_RATE):
+        sr = SAMPLE_RATE
+        # pas de la grille de contrôle (en samples)
+        self.control_step = sr / control_rate if control_rate else 1.0
+        self.random = random = random_source(rng)
+        self.n = int(sr * duration)
+        self.dt = duration / self.n if self.n else 0.0   # pas de np.linspace(0, duration, n, endpoint=False)
+        self.D = D
+
+        self.f0 = 220 + 440 * A * random.uniform(0, A)  # base pitch
+
+        self.pitch = pitch_plan(P, A, D, duration, random)
+        self.notes = note_plan(P, A, D, self.n, duration, random)
+
+        # oscillateurs : fondamentale puis harmoniques (multiplicateur de phase, amplitude)
+        multipliers, amplitudes = [1.0], [1.0]
+        num_harmonics = int(2 + 10 * A)
+        for k in range(2, 2 + num_harmonics):
+            amp = 1 / k
+            # écart entre harmoniques pour un timbre plus naturel
+            # P proche de 1 → ratios stables (plaisir)
+            # P faible → ratios légèrement décalés (mineur / sombre)
+            # base_ratio = k if P > 0.5 else k * rd.uniform(-0.3, 0.3)
+            inharm = (1 - P) * random.uniform(-0.15, 0.15)
+            freq_ratio = k * (1 + inharm)
+
+            # Arousal → ajouter un petit random pour rendre la voix moins robotique
+            freq_ratio = freq_ratio + random.uniform(-0.07, 0.07) * A
+
+            multipliers.append(k * freq_ratio)
+            amplitudes.append(amp)
+
+        self.oscillators = OscillatorBank(multipliers, amplitudes)
+
+        # bruit
+        self.noise_amp = 0.08 + 0.1 * A * (1 - D)
+
+        # gain selon Dominance
+        self.gain = 0.2 + 0.8 * D
+
+        # --- enveloppe ---
+        # attaque dépendante de l'arousal
+        attack_time = 0.2 + (1 - A + 0.01) * 0.5
+        self.attack_n = min(int(sr * attack_time), self.n // 2)
+        self.sustain_level = 0.6 + 0.4 * D
+        # release doux
+        release_ratio = 0.3 + 0.4 * (1 - A)
+        self.release_n = min(int(release_ratio * self.n), self.n - self.attack_n)
+
+        # --- état reporté entre blocs ---
+        self.pos = 0
+        self._freq_sum = 0.0     # somme cumulée des fréquences (intégration de phase)
+
+    @property
+    def done(self) -> bool:
+        return self.pos >= self.n
+
+    def _envelope(self, i):
+        """Enveloppe aux positions i (samples, éventuellement fractionnaires)."""
+        env = np.ones(len(i))
+
+        # attaque puis sustain
+        attack = i < self.attack_n
+        env[attack] = _ramp(i[attack], self.attack_n)
+        env *= self.sustain_level
+
+        # montée progressive sur toute la durée
+        env *= 0.2 + 0.8 * _ramp(i, self.n)
+
+        # release doux
+        if self.release_n > 0:
+            release = i >= self.n - self.release_n
+            r = _ramp(i[release] - (self.n - self.release_n), self.release_n)
+            env[release] *= (1 - r) * np.exp(-4.5 * r)
+
+        return env
+
+    def render(self, count: int) -> np.ndarray:
+        """Les `count` samples suivants (moins à la fin du son), en float32."""
+        start, stop = self.pos, min(self.pos + count, self.n)
+        self.pos = stop
+        i = np.arange(start, stop)
+        if len(i) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # grille de contrôle couvrant le bloc (multiples de control_step)
+        step = self.control_step
+        c = np.arange(np.floor(start / step), np.ceil((stop - 1) / step) + 1) * step
+        c = np.minimum(c, self.n - 1)
+
+        # dominance = morph
+        C = (1 - self.D) * pitch_at(self.pitch, c * self.dt) + self.D * note_at(self.notes, c)
+
+        # fréquence instantanée (interpolée à la fréquence audio)
+        f = np.interp(i, c, self.f0 * (2 ** C))
+
+        # intégration de phase (reportée depuis le bloc précédent)
+        cumsum = self._freq_sum + np.cumsum(f)
+        self._freq_sum = cumsum[-1]
+        phase = 2 * np.pi * cumsum / SAMPLE_RATE
+
+        # banc d'oscillateurs (float32) : table pour les partiels harmoniques,
+        # sinus pour les autres ; rien au-dessus de Nyquist sur le bloc
+        signal = self.oscillators.render(phase, f)
+
+        # bruit
+        signal += (self.noise_amp * self.random.randn(len(i))).astype(np.float32)
+
+        out = (self.gain * np.interp(i, c, self._envelope(c))).astype(np.float32)
+        out *= signal
+        return out
+
+
+def generate_sound(P, A, D, duration, rng=None, control_rate=CONTROL_RATE):
+    """
+    Son complet (float32). Avec rng (graine ou np.random.Generator), le son
+    ne dépend que de ses paramètres ; sinon il utilise l'état global.
+    """
+    synth = SoundSynth(P, A, D, duration, rng, control_rate)
+    return synth.render(synth.n)
+
+
+def generate_sound_stream(P, A, D, duration, block_size=BLOCK_SIZE, rng=None, control_rate=CONTROL_RATE):
+    """
+    Version streaming de generate_sound : générateur de blocs float32 de
+    block_size samples (le dernier peut être plus court). Le premier bloc
+    est disponible sans attendre la synthèse du son complet.
+    """
+    synth = SoundSynth(P, A, D, duration, rng, control_rate)
+    while not synth.done:
+        yield synth.render(block_size)
@@ -0,0 +1,30 @@
+import random
+
+from creation_mouvement.robot_config_space import pose_generation
+
+FEAR = (0.1, 0.9, 0.2)     # pad.json
+
+
+def test_antenna_drift_advances_once_per_pose(monkeypatch):
+    calls = {"head": 0, "antennas": 0}
+    generate_head, moving_antennas = pose_generation._generate_head, pose_generation.moving_antennas
+
+    def counting_head(*args):
+        calls["head"] += 1
+        return generate_head(*args)
+
+    def counting_antennas(*args):
+        calls["antennas"] += 1
+        return moving_antennas(*args)
+
+    monkeypatch.setattr(pose_generation, "_generate_head", counting_head)
+    monkeypatch.setattr(pose_generation, "moving_antennas", counting_antennas)
+
+    random.seed(0)
+    n = 50
+    poses = [pose_generation.generate_pose(*FEAR) for _ in range(n)]
+
+    assert calls["antennas"] == n
+    assert calls["head"] > n            # some draws were rejected
+    assert all(len(pose["antennas"]) == 2 for pose in poses)
+    assert list(poses[0])[:7] == ["x", "y", "z", "roll", "pitch", "yaw", "antennas"]
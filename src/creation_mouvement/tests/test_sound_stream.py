@@ -0,0 +1,44 @@
+import numpy as np
+
+from creation_mouvement.sound.sound_generation import generate_sound, generate_sound_stream
+from synth_core import BandLimitedWavetable, additive
+
+PADS = [(0.8, 0.9, 0.5), (0.0, 0.0, 0.0), (0.3, 1.0, 0.2), (-0.5, 0.6, -0.7), (0.2, -0.1, 0.5)]
+
+# the only allowed difference: float32 rounding of the partial mix (BLAS)
+TOLERANCE = 1e-6
+
+
+def test_stream_matches_full_render():
+    for pad in PADS:
+        full = generate_sound(*pad, 2.0, rng=3)
+        for block_size in (441, 1000, 4096):
+            stream = np.concatenate(list(generate_sound_stream(*pad, 2.0, block_size=block_size, rng=3)))
+            assert len(stream) == len(full)
+            assert np.abs(stream - full).max() <= TOLERANCE, (pad, block_size)
+
+
+def test_additive_culling_does_not_depend_on_blocks():
+    rng = np.random.default_rng(0)
+    n = 20000
+    frequency = 600 * 2 ** np.cumsum(rng.normal(0, 0.01, n))
+    phase = np.cumsum(2 * np.pi * frequency / 44100)
+    multipliers = np.arange(1, 60) * 1.01
+    amplitudes = 1 / np.arange(1, 60)
+
+    full = additive(phase, multipliers, amplitudes, frequency=frequency)
+    for step in (441, 1000, 3000):
+        chunks = [additive(phase[i:i + step], multipliers, amplitudes, frequency=frequency[i:i + step])
+                  for i in range(0, n, step)]
+        assert np.abs(np.concatenate(chunks) - full).max() <= TOLERANCE, step
+
+
+def test_wavetable_levels_do_not_depend_on_blocks():
+    table = BandLimitedWavetable([1, 2, 3, 5, 8], [1.0, 0.5, 0.3, 0.2, 0.1])
+    frequency = np.geomspace(30, 15000, 50000)     # crosses every mip level
+    phase = np.cumsum(2 * np.pi * frequency / 44100)
+
+    full = table.render(phase, frequency)
+    for step in (441, 1000, 3000):
+        chunks = [table.render(phase[i:i + step], frequency[i:i + step]) for i in range(0, len(phase), step)]
+        assert np.array_equal(np.concatenate(chunks), full), step
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from .registry import EmotionRegistry
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+# PAD tables of the project
+MEHRABIAN_TABLE = SRC_DIR / "adaptation_mouvement" / "prompts" / "pad_mehrabian.json"   # values in [-1, 1]
+CREATION_TABLE = SRC_DIR / "creation_mouvement" / "emotional_space" / "pad.json"        # values in [0, 1]
+
+_registries = {}
+
+
+def load_registry(path: str | Path, **kwargs) -> EmotionRegistry:
+    """Shared registry for a table: each file is loaded once per process."""
+    path = Path(path).resolve()
+    if path not in _registries:
+        _registries[path] = EmotionRegistry(path, **kwargs)
+    return _registries[path]
+
+
+__all__ = ["EmotionRegistry", "load_registry", "MEHRABIAN_TABLE", "CREATION_TABLE"]
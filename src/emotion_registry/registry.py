@@ -0,0 +1,103 @@
+"""Named emotion presets in PAD space, loaded from a JSON table.
+
+The table format is the one of creation_mouvement/emotional_space/pad.json:
+    {"axes": {...}, "emotions": {"joy": {"P": .., "A": .., "D": ..}, ...}}
+
+The file is read once and reloaded only when its modification time changes.
+Nearest-preset queries are a brute-force distance scan in NumPy: tables hold
+a handful of presets, so this is fast enough to label a live PAD stream at
+every tick and keeps scipy out of the import path.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+class EmotionRegistry:
+    """
+    Emotion presets of one PAD table.
+
+    Lookups never raise on unknown names: get() returns None.
+    The file's mtime is checked at most every `check_interval` seconds
+    (0 to check at every access), so queries stay in the microsecond range.
+    """
+
+    def __init__(self, path: str | Path, check_interval: float = 1.0,
+                 clock=time.monotonic):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._clock = clock
+        self._mtime = None
+        self._next_check = -np.inf
+        self._load()
+
+    # --- loading ---
+    def _load(self) -> None:
+        mtime = os.stat(self.path).st_mtime_ns
+        with self.path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        emotions = {
+            name.lower(): (float(v["P"]), float(v["A"]), float(v["D"]))
+            for name, v in data["emotions"].items()
+        }
+        names = list(emotions)
+        vectors = np.array([emotions[n] for n in names], dtype=float).reshape(-1, 3)
+
+        # replaced as a whole, readers in other threads see either table
+        self._table = (emotions, names, vectors)
+        self.axes = data.get("axes", {})
+        self._mtime = mtime
+
+    def _current(self):
+        now = self._clock()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            try:
+                if os.stat(self.path).st_mtime_ns != self._mtime:
+                    self._load()
+            except (OSError, ValueError, KeyError) as e:
+                # file being rewritten or invalid: keep the previous table
+                print(f"Emotion table {self.path} not reloaded: {e}")
+        return self._table
+
+    # --- named access ---
+    def names(self) -> list[str]:
+        return list(self._current()[1])
+
+    def get(self, name: str) -> tuple[float, float, float] | None:
+        """PAD values of a named emotion, None if unknown."""
+        return self._current()[0].get(name.strip().lower())
+
+    def as_dict(self) -> dict[str, tuple[float, float, float]]:
+        return dict(self._current()[0])
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._current()[1])
+
+    # --- PAD space queries ---
+    @staticmethod
+    def _squared_distances(vectors, pad) -> np.ndarray:
+        diff = vectors - np.asarray(pad, dtype=float)
+        return np.einsum("ij,ij->i", diff, diff)
+
+    def nearest(self, pad) -> tuple[str, float]:
+        """Closest named emotion to a PAD vector: (name, euclidean distance)."""
+        _, names, vectors = self._current()
+        d2 = self._squared_distances(vectors, pad)
+        index = int(np.argmin(d2))
+        return names[index], float(np.sqrt(d2[index]))
+
+    def k_nearest(self, pad, k: int = 3) -> list[tuple[str, float]]:
+        """The k closest presets to a PAD vector, closest first: [(name, distance), ...]."""
+        _, names, vectors = self._current()
+        d2 = self._squared_distances(vectors, pad)
+        indices = np.argsort(d2, kind="stable")[:k]
+        return [(names[i], float(np.sqrt(d2[i]))) for i in indices]
@@ -1,16 +1,20 @@
+import os
 import gym
 from gym import spaces
 import numpy as np
-from notes_to_wave import notes_to_wav
+import soundfile as sf
+from notes_to_wave import render_notes, SAMPLE_RATE
 from Note import Note
 from interface_input import input
 from emotion import polar_to_emotion, random_emotion
 
 class SoundGenEnv(gym.Env):
-    def __init__(self, emotion_model, max_notes=16):
+    def __init__(self, emotion_model, max_notes=16, save_dir=None):
         self.EMOTION_MODEL = emotion_model
         super().__init__()
         self.max_notes = max_notes
+        self.save_dir = save_dir  # if set, each evaluated sequence is also written there as a WAV
+        self.episode = 0
         self.current_step = 0
         self.notes = []
         self.note_range = 24  # MIDI notes from G2 to G4
@@ -26,6 +30,7 @@ class SoundGenEnv(gym.Env):
     def reset(self):
         self.notes = []
         self.current_step = 0
+        self.episode += 1
         self.target_emotion = random_emotion(self.EMOTION_MODEL)
         return self._get_obs()
 
@@ -45,11 +50,22 @@ class SoundGenEnv(gym.Env):
 
 
     def estimate_emotion(self, notes):
-        notes_to_wav(notes, "temp/temp.wav")
-        interface = input(self.EMOTION_MODEL)
+        # Rendered in memory and played from the buffer: no file shared between envs
+        audio = render_notes(notes)
+        if self.save_dir is not None:
+            self.save_audio(audio)
+        interface = input(self.EMOTION_MODEL, audio=audio, samplerate=SAMPLE_RATE)
         return interface.loop()
 
 
+    def save_audio(self, audio):
+        # One file per env and episode, so parallel envs never write the same path
+        os.makedirs(self.save_dir, exist_ok=True)
+        path = os.path.join(self.save_dir, f"env{os.getpid()}-{id(self):x}_{self.episode:05d}.wav")
+        sf.write(path, audio, SAMPLE_RATE)
+        return path
+
+
     def evaluate_sequence(self, notes):
         emotion_generated = self.estimate_emotion(notes)
         reward = -np.linalg.norm(np.array(emotion_generated) - np.array(self.target_emotion))
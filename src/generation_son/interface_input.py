@@ -10,20 +10,25 @@ import sys
 WINDOW_SIZE = 800
 CANVAS_SIZE = 700
 POINT_RADIUS = 5
-WAV_FILE = "temp/temp.wav"  # fichier à jouer
+WAV_FILE = "temp/temp.wav"  # fichier à jouer si aucun buffer n'est fourni
 
 class input:
-    def __init__(self, EMOTION_MODEL):
+    def __init__(self, EMOTION_MODEL, audio=None, samplerate=None):
         self.EMOTION_MODEL = EMOTION_MODEL
         self.selected_emotion = None
+        self.audio = audio  # buffer float32 déjà rendu, joué sans passer par le disque
+        self.samplerate = samplerate
         self.on_play()
 
     def on_play(self):
         try:
-            data, samplerate = sf.read("temp.wav", dtype='float32')
-            sd.play(data, samplerate)
+            if self.audio is not None:
+                sd.play(self.audio, self.samplerate)
+            else:
+                data, samplerate = sf.read(WAV_FILE, dtype='float32')
+                sd.play(data, samplerate)
         except Exception as e:
-            print(f"Erreur lors de la lecture du fichier : {e}")
+            print(f"Erreur lors de la lecture du son : {e}")
             
     def on_next(self):
         if self.EMOTION_MODEL["system"] == "wheel":
@@ -1,8 +1,18 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import soundfile as sf
 import math
 from Note import Note
 
+# dossier src/ : modules partagés entre les sous-projets (synth_core, ...)
+SRC_DIR = Path(__file__).resolve().parents[2]
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+
+from synth_core import additive, oscillator_bank
+
 SAMPLE_RATE = 44100
 A4_PITCH = 49
 A4_FREQ = 440.0
@@ -34,13 +44,34 @@ harmonics_soft = [
 
 harmonics = harmonics_soft
 
-def generate_piano_like_wave(freq, duration, intensity):
-    t = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+# partiels agressifs du sifflement (inharmoniques : pas de table possible)
+whistle_partials = [
+    (1.00, 1.00),
+    (2.01, 0.05),
+    (6.87, 0.015),
+]
+
+def harmonic_wave(phase, freq, oscillator="bank"):
+    """
+    Timbre `harmonics` sur une phase donnée, sans les partiels au-dessus de Nyquist.
+    oscillator : "bank" (une lecture de table band-limited par sample)
+    ou "additive" (un sinus par partiel).
+    """
+    if oscillator == "additive":
+        multipliers, amplitudes = zip(*harmonics)
+        return additive(phase, multipliers, amplitudes, frequency=freq)
+    return oscillator_bank(harmonics).render(phase, freq)
+
+
+def n_samples(duration, length=None):
+    """Nombre de samples : `length` s'il est donné (exact), sinon int(SAMPLE_RATE * duration)."""
+    return int(SAMPLE_RATE * duration) if length is None else length
+
 
-    wave = np.zeros_like(t)
+def generate_piano_like_wave(freq, duration, intensity, oscillator="bank", length=None):
+    t = np.arange(n_samples(duration, length)) / SAMPLE_RATE
 
-    for multiplier, amplitude in harmonics:
-        wave += amplitude * np.sin(2 * math.pi * freq * multiplier * t)
+    wave = harmonic_wave(2 * math.pi * freq * t, freq, oscillator)
 
     # enveloppe piano-like
     N = len(t)
@@ -51,7 +82,7 @@ def generate_piano_like_wave(freq, duration, intensity):
     attack = min(attack, N)
     decay = min(decay, N - attack)
 
-    envelope = np.zeros(N)
+    envelope = np.zeros(N, dtype=np.float32)
     envelope[:attack] = np.linspace(0, 1, attack)
     envelope[attack:attack+decay] = np.linspace(1, 0, decay)
 
@@ -61,8 +92,8 @@ def generate_piano_like_wave(freq, duration, intensity):
 
     return wave
 
-def generate_whistle_wave(freq, duration, intensity):
-    N = int(SAMPLE_RATE * duration)
+def generate_whistle_wave(freq, duration, intensity, length=None):
+    N = n_samples(duration, length)
     t = np.arange(N) / SAMPLE_RATE
 
     # FM rapide
@@ -73,19 +104,10 @@ def generate_whistle_wave(freq, duration, intensity):
 
     phase = np.cumsum(2 * np.pi * freq_t / SAMPLE_RATE)
 
-    # partiels agressifs
-    partials = [
-        (1.00, 1.00),
-        (2.01, 0.05),
-        (6.87, 0.015),
-    ]
-
-    wave = np.zeros(N)
-    for mult, amp in partials:
-        wave += amp * np.sin(mult * phase)
+    wave = oscillator_bank(whistle_partials).render(phase, freq_t)
 
     # bruit HF
-    wave += 0.02 * np.random.randn(N)
+    wave += (0.02 * np.random.randn(N)).astype(np.float32)
 
     # saturation douce
     wave = np.tanh(2.5 * wave)
@@ -93,7 +115,7 @@ def generate_whistle_wave(freq, duration, intensity):
     # enveloppe simple
     attack = int(0.01 * SAMPLE_RATE)
     release = int(0.05 * SAMPLE_RATE)
-    env = np.ones(N)
+    env = np.ones(N, dtype=np.float32)
     env[:attack] = np.linspace(0, 1, attack)
     env[-release:] *= np.linspace(1, 0, release)
 
@@ -113,21 +135,25 @@ def duration_to_seconds(duration, bpm=DEFAULT_BPM):
     return duration * quarter_note
 
 
-def generate_note_wave(note: Note, bpm=DEFAULT_BPM):
-    freq = pitch_to_frequency(note.pitch)
-
+def note_lengths(note: Note, bpm=DEFAULT_BPM):
+    """Nombre de samples (son, silence) d'une note."""
     total_duration = duration_to_seconds(note.duration, bpm)
-
     sound_duration = min(0.2, total_duration)  # note courte
-    sound = generate_whistle_wave(freq, sound_duration, note.intensity)
-
     silence_duration = total_duration - sound_duration
-    silence = np.zeros(int(SAMPLE_RATE * silence_duration))
+    return int(SAMPLE_RATE * sound_duration), int(SAMPLE_RATE * silence_duration)
 
-    return np.concatenate([sound, silence])
 
-def generate_slide_wave(pitch_start, pitch_end, duration, intensity):
-    N = int(SAMPLE_RATE * duration)
+def generate_note_wave(note: Note, bpm=DEFAULT_BPM):
+    freq = pitch_to_frequency(note.pitch)
+    sound_n, silence_n = note_lengths(note, bpm)
+
+    # son puis silence, dans un seul buffer
+    wave = np.zeros(sound_n + silence_n, dtype=np.float32)
+    wave[:sound_n] = generate_whistle_wave(freq, sound_n / SAMPLE_RATE, note.intensity, length=sound_n)
+    return wave
+
+def generate_slide_wave(pitch_start, pitch_end, duration, intensity, oscillator="bank", length=None):
+    N = n_samples(duration, length)
 
     # interpolation linéaire en pitch
     pitch_t = np.linspace(pitch_start, pitch_end, N)
@@ -136,44 +162,79 @@ def generate_slide_wave(pitch_start, pitch_end, duration, intensity):
     # intégration de phase
     phase = np.cumsum(2 * np.pi * freq_t / SAMPLE_RATE)
 
-    wave = np.zeros(N)
-
-    for mult, amp in harmonics:
-        wave += amp * np.sin(mult * phase)
+    wave = harmonic_wave(phase, freq_t, oscillator)
 
     # enveloppe simple
     attack = int(0.02 * SAMPLE_RATE)
-    envelope = np.ones(N)
+    envelope = np.ones(N, dtype=np.float32)
     envelope[:attack] = np.linspace(0, 1, attack)
     envelope *= intensity
 
     return wave * envelope
 
 
-def notes_to_wav(notes, output_path, bpm=DEFAULT_BPM):
-    audio = np.array([], dtype=np.float32)
-
-    for i,note in enumerate(notes):
-        if (i > 0):
-            prev_note = notes[i-1]
-            if note.slide:
-                slide_wave = generate_slide_wave(prev_note.pitch, note.pitch, duration_to_seconds(note.duration, bpm), note.intensity)
-                audio = np.concatenate((audio, slide_wave))
-        audio = np.concatenate((audio, generate_note_wave(note, bpm)))
+def notes_layout(notes, bpm=DEFAULT_BPM):
+    """
+    Placement de la séquence : liste de (type, début, longueur, notes concernées)
+    et longueur totale en samples. Un glissando précède une note marquée slide.
+    """
+    layout = []
+    offset = 0
+    for i, note in enumerate(notes):
+        if i > 0 and note.slide:
+            slide_n = int(SAMPLE_RATE * duration_to_seconds(note.duration, bpm))
+            layout.append(("slide", offset, slide_n, (notes[i-1], note)))
+            offset += slide_n
+        sound_n, silence_n = note_lengths(note, bpm)
+        layout.append(("note", offset, sound_n, (note,)))
+        offset += sound_n + silence_n
+    return layout, offset
+
+
+def render_notes(notes, bpm=DEFAULT_BPM, normalize=True):
+    """
+    Rendu en mémoire d'une séquence de notes (float32, mono, SAMPLE_RATE).
+    La longueur totale est calculée d'avance ; chaque note et glissando
+    est mixé en place dans un unique buffer.
+    """
+    layout, total = notes_layout(notes, bpm)
+    audio = np.zeros(total, dtype=np.float32)
+
+    for kind, offset, length, args in layout:
+        if length == 0:
+            continue
+        if kind == "slide":
+            prev_note, note = args
+            wave = generate_slide_wave(prev_note.pitch, note.pitch, length / SAMPLE_RATE, note.intensity,
+                                       length=length)
+        else:
+            note, = args
+            wave = generate_whistle_wave(pitch_to_frequency(note.pitch), length / SAMPLE_RATE, note.intensity,
+                                         length=length)
+        audio[offset:offset + length] += wave
 
     # Anti-clipping
-    peak = np.max(np.abs(audio))
-    if peak > 0:
-        audio /= peak
+    if normalize:
+        peak = np.max(np.abs(audio), initial=0.0)
+        if peak > 0:
+            audio /= peak
+
+    return audio
 
+
+def notes_to_wav(notes, output_path, bpm=DEFAULT_BPM):
+    audio = render_notes(notes, bpm)
     sf.write(output_path, audio, SAMPLE_RATE)
     print(f"WAV généré : {output_path}")
+    return audio
 
-notes = [
-    Note(55, 0.7, 1,False),  # noire
-    Note(44, 0.7, 2, True),  # noire
-    Note(47, 0.7, 1,True),  # noire
-    Note(52, 1.0, 4, False),  # ronde
-]
 
-notes_to_wav(notes, "melodie2.wav")
\ No newline at end of file
+if __name__ == "__main__":
+    notes = [
+        Note(55, 0.7, 1,False),  # noire
+        Note(44, 0.7, 2, True),  # noire
+        Note(47, 0.7, 1,True),  # noire
+        Note(52, 1.0, 4, False),  # ronde
+    ]
+
+    notes_to_wav(notes, "melodie2.wav")
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+GENERATION_SON = Path(__file__).resolve().parents[1]
+for path in (GENERATION_SON, GENERATION_SON / "synthesis"):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from Note import Note
+from notes_to_wave import generate_note_wave, note_lengths, notes_layout, render_notes
+
+NOTES = [
+    Note(55, 0.7, 1, False),
+    Note(44, 0.7, 2, True),
+    Note(47, 0.7, 1, True),
+    Note(52, 1.0, 4, False),
+    Note(60, 0.4, 3, True),
+]
+
+
+def test_render_notes_over_bpm_range():
+    # durations in seconds do not round trip to sample counts for every BPM
+    for bpm in range(40, 401):
+        _, total = notes_layout(NOTES, bpm)
+        audio = render_notes(NOTES, bpm)
+        assert audio.dtype == np.float32
+        assert len(audio) == total, bpm
+        assert np.isfinite(audio).all(), bpm
+
+
+def test_generate_note_wave_length_over_bpm_range():
+    for bpm in range(40, 401):
+        for note in NOTES:
+            assert len(generate_note_wave(note, bpm)) == sum(note_lengths(note, bpm)), bpm
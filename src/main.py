@@ -1,20 +1,46 @@
-from creation_mouvement import generate
-# from adaptation_mouvement import adapt
-# from generation_son import train 
+import argparse
+import sys
+from pathlib import Path
 
-def main():
-    mode = int(input("\n\nBonjour ! Quel mode voulez-vous lancer ? Tapez juste 1, 2 ou 3.\n\n1 = Adaptation d'un mouvement\n2 = Génération d'un mouvement avec son\n3 = Entraînement de l'IA pour le son\n\nVotre choix : "))
+MODES = {
+    1: "Adaptation d'un mouvement",
+    2: "Génération d'un mouvement avec son",
+    3: "Entraînement de l'IA pour le son",
+}
+
+
+def ask_mode() -> int:
+    menu = "\n".join(f"{k} = {v}" for k, v in MODES.items())
+    return int(input(f"\n\nBonjour ! Quel mode voulez-vous lancer ? Tapez juste 1, 2 ou 3.\n\n{menu}\n\nVotre choix : "))
+
+
+def main(argv: list[str] | None = None):
+    """
+    Point d'entrée commun : `python main.py --mode 1 --emotion joy --duration 5`.
+    Les arguments non reconnus sont transmis au mode lancé.
+    Chaque mode n'importe ses dépendances (reachy_mini, scipy, stable_baselines3)
+    qu'au moment où il est lancé.
+    """
+    parser = argparse.ArgumentParser(description="Reachy Mini I3R")
+    parser.add_argument("--mode", type=int, choices=list(MODES), help="mode à lancer (demandé si absent)")
+    args, mode_argv = parser.parse_known_args(argv)
+
+    mode = args.mode if args.mode is not None else ask_mode()
 
     print(f"Lancement du module : {mode}")
 
     if mode == 1:
-        print("Mode non implémenté pour l'instant.")
-        # adapt.main()
+        # les modules d'adaptation_mouvement s'importent entre eux depuis leur dossier
+        sys.path.insert(0, str(Path(__file__).parent / "adaptation_mouvement"))
+        import adapt
+        adapt.main(mode_argv)
     elif mode == 2:
-        generate.main()
+        from creation_mouvement import generate
+        generate.main(mode_argv)
     elif mode == 3:
         print("Mode d'entraînement non implémenté pour l'instant.")
+        # from generation_son import train
         # train.train()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,20 @@
+from .mini import LocalReachyMini, LocalMedia, create_head_pose
+
+BACKENDS = ("robot", "local")
+
+
+def connect(backend: str = "robot", **kwargs):
+    """
+    Open a robot connection: the real ReachyMini SDK ("robot")
+    or the in-process simulated stand-in ("local").
+    Keyword arguments are passed to the constructor.
+    """
+    if backend == "robot":
+        from reachy_mini import ReachyMini
+        return ReachyMini(**kwargs)
+    if backend == "local":
+        return LocalReachyMini(**kwargs)
+    raise ValueError(f"Unknown backend: {backend} (available: {BACKENDS})")
+
+
+__all__ = ["LocalReachyMini", "LocalMedia", "create_head_pose", "connect", "BACKENDS"]
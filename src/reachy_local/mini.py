@@ -0,0 +1,211 @@
+"""Local stand-in for reachy_mini.ReachyMini, used for headless benchmarking.
+
+LocalReachyMini implements the subset of the SDK used by this project
+(set_target, goto_target, look_at_world, media.push_audio_sample).
+It timestamps and records every command and simulates how the robot would
+follow it, so throughput, jitter and tracking error of our control loops
+can be measured without a robot or a daemon.
+"""
+
+import time
+
+import numpy as np
+
+
+def _rotation(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Extrinsic xyz Euler angles (radians) to a rotation matrix, like scipy's from_euler("xyz")."""
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    return np.array([
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr],
+    ])
+
+
+def create_head_pose(x=0.0, y=0.0, z=0.0, roll=0.0, pitch=0.0, yaw=0.0, mm=False, degrees=True) -> np.ndarray:
+    """Same signature and convention as reachy_mini.utils.create_head_pose."""
+    if degrees:
+        roll, pitch, yaw = np.radians([roll, pitch, yaw])
+    pose = np.eye(4)
+    pose[:3, :3] = _rotation(roll, pitch, yaw)
+    pose[:3, 3] = [x, y, z]
+    if mm:
+        pose[:3, 3] /= 1000.0
+    return pose
+
+
+def _rotation_error(a: np.ndarray, b: np.ndarray) -> float:
+    """Angle (rad) of the relative rotation between two poses."""
+    cos = (np.trace(a[:3, :3].T @ b[:3, :3]) - 1.0) / 2.0
+    return float(np.arccos(np.clip(cos, -1.0, 1.0)))
+
+
+def _minjerk(u: np.ndarray) -> np.ndarray:
+    return 10 * u**3 - 15 * u**4 + 6 * u**5
+
+
+class LocalMedia:
+    """Records audio pushed to the robot instead of playing it."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.playing = False
+        self.samples = []        # (timestamp, number of samples)
+
+    def start_playing(self):
+        self.playing = True
+
+    def stop_playing(self):
+        self.playing = False
+
+    def push_audio_sample(self, data):
+        self.samples.append((self._clock(), len(data)))
+
+
+class LocalReachyMini:
+    """
+    Drop-in replacement for ReachyMini running entirely in-process.
+
+    - set_target: the command is timestamped and recorded; the simulated head
+      and antennas follow the last target with a first-order lag of time
+      constant `tau`, and the tracking error is measured at each new command.
+    - goto_target: the interpolation (min-jerk or linear) is sampled at
+      `sim_rate` and recorded; it blocks for `duration` if `realtime`.
+    """
+
+    def __init__(self, *args, tau: float = 0.05, sim_rate: float = 100.0,
+                 realtime: bool = True, clock=time.perf_counter, **kwargs):
+        self.tau = tau
+        self.sim_rate = sim_rate
+        self.realtime = realtime
+        self._clock = clock
+        self.media = LocalMedia(clock)
+
+        # simulated state
+        self.head = np.eye(4)
+        self.antennas = np.zeros(2)
+        self.body_yaw = 0.0
+        self._target_head = self.head.copy()         # most recently applied target
+        self._target_antennas = self.antennas.copy()
+        self._last_update = None
+
+        # recordings
+        self.commands = []       # (timestamp, kind, head, antennas, body_yaw)
+        self.errors = []         # (rotation error rad, translation error m, antennas error rad)
+        self.states = []         # (timestamp, head, antennas) sampled during goto_target
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    # --- simulation ---
+    def _follow(self, now: float) -> None:
+        """Advance the simulated state towards the current target (first-order lag)."""
+        if self._last_update is not None and self.tau > 0:
+            k = 1.0 - np.exp(-(now - self._last_update) / self.tau)
+            self.head = self.head + k * (self._target_head - self.head)
+            self.antennas = self.antennas + k * (self._target_antennas - self.antennas)
+        else:
+            self.head = self._target_head.copy()
+            self.antennas = self._target_antennas.copy()
+        self._last_update = now
+
+    def _record(self, kind, head, antennas, body_yaw) -> float:
+        now = self._clock()
+        self.commands.append((
+            now, kind,
+            None if head is None else np.array(head, dtype=float),
+            None if antennas is None else np.array(antennas, dtype=float),
+            body_yaw,
+        ))
+        return now
+
+    # --- SDK interface ---
+    def set_target(self, head=None, antennas=None, body_yaw=None):
+        now = self._record("set_target", head, antennas, body_yaw)
+        self._follow(now)
+
+        # tracking error: where the simulated robot is now (after following the
+        # previously applied target) vs the target applied by this call; omitted
+        # fields keep the previously applied target
+        target_head = self._target_head if head is None else np.asarray(head, dtype=float)
+        target_antennas = self._target_antennas if antennas is None else np.asarray(antennas, dtype=float)
+        self.errors.append((
+            _rotation_error(self.head, target_head),
+            float(np.linalg.norm(self.head[:3, 3] - target_head[:3, 3])),
+            float(np.abs(self.antennas - target_antennas).max()),
+        ))
+
+        self._target_head = target_head.copy()
+        self._target_antennas = target_antennas.copy()
+        if body_yaw is not None:
+            self.body_yaw = body_yaw
+
+    def goto_target(self, head=None, antennas=None, duration=0.5, method="minjerk", body_yaw=None):
+        start = self._record("goto_target", head, antennas, body_yaw)
+        self._follow(start)
+
+        head_from, ant_from = self.head.copy(), self.antennas.copy()
+        head_to = head_from if head is None else np.asarray(head, dtype=float)
+        ant_to = ant_from if antennas is None else np.asarray(antennas, dtype=float)
+
+        n = max(int(duration * self.sim_rate), 1)
+        u = np.linspace(0.0, 1.0, n + 1)[1:]
+        if str(method).lower().endswith("linear"):
+            s = u
+        else:
+            s = _minjerk(u)
+        for ti, si in zip(u * duration, s):
+            self.states.append((start + ti, head_from + si * (head_to - head_from), ant_from + si * (ant_to - ant_from)))
+
+        if self.realtime:
+            time.sleep(duration)
+
+        self.head, self.antennas = head_to.copy(), ant_to.copy()
+        self._target_head, self._target_antennas = head_to.copy(), ant_to.copy()
+        self._last_update = self._clock()
+        if body_yaw is not None:
+            self.body_yaw = body_yaw
+
+    def look_at_world(self, x, y, z, duration=1.0, perform_movement=True):
+        """Pose orienting the head (x axis forward) towards the point (x, y, z) in metres."""
+        direction = np.array([x, y, z], dtype=float) - self.head[:3, 3]
+        yaw = np.arctan2(direction[1], direction[0])
+        pitch = -np.arctan2(direction[2], np.hypot(direction[0], direction[1]))
+        pose = create_head_pose(x=self.head[0, 3], y=self.head[1, 3], z=self.head[2, 3],
+                                pitch=pitch, yaw=yaw, degrees=False)
+        if perform_movement:
+            self.goto_target(head=pose, duration=duration)
+        return pose
+
+    # --- analysis ---
+    def stats(self) -> dict:
+        """Throughput, inter-command jitter and tracking error of the set_target stream."""
+        stamps = np.array([c[0] for c in self.commands if c[1] == "set_target"])
+        result = {
+            "commands": len(self.commands),
+            "set_target": len(stamps),
+            "audio_samples": sum(n for _, n in self.media.samples),
+        }
+        if len(stamps) > 1:
+            intervals = np.diff(stamps)
+            result["rate_hz"] = float((len(stamps) - 1) / (stamps[-1] - stamps[0]))
+            result["interval_mean_ms"] = float(intervals.mean() * 1e3)
+            result["jitter_std_ms"] = float(intervals.std() * 1e3)
+            result["jitter_p99_ms"] = float(np.percentile(np.abs(intervals - intervals.mean()), 99) * 1e3)
+        if self.errors:
+            errors = np.array(self.errors)
+            result["rotation_error_mean_rad"] = float(errors[:, 0].mean())
+            result["rotation_error_max_rad"] = float(errors[:, 0].max())
+            result["translation_error_max_m"] = float(errors[:, 1].max())
+            result["antennas_error_max_rad"] = float(errors[:, 2].max())
+        return result
+
+    def report(self) -> None:
+        print("\n--- Local backend ---")
+        for k, v in self.stats().items():
+            print(f"{k:>26} : {v:.4f}" if isinstance(v, float) else f"{k:>26} : {v}")
@@ -0,0 +1,12 @@
+from .additive import BLOCK_SIZE, SAMPLE_RATE, additive
+from .wavetable import BandLimitedWavetable
+from .oscillator import OscillatorBank, oscillator_bank
+
+__all__ = [
+    "BLOCK_SIZE",
+    "SAMPLE_RATE",
+    "additive",
+    "BandLimitedWavetable",
+    "OscillatorBank",
+    "oscillator_bank",
+]
@@ -0,0 +1,64 @@
+"""Additive synthesis kernel shared by the sound generators.
+
+All partials are evaluated at once, block by block: for each block of
+samples, the (samples x partials) phase matrix is range-reduced to
+[-pi, pi] in float64, converted to float32, passed through a single
+np.sin call and mixed with one matrix-vector product. Temporary memory is
+bounded by block_size x n_partials, independent of the sound's duration.
+
+When the instantaneous fundamental frequency is given, partials above the
+Nyquist frequency are muted sample by sample: they would only add aliasing.
+Partials above Nyquist over a whole block are skipped for that block (no
+CPU cost), only those crossing it inside the block are masked. The result
+depends on each sample's frequency, not on where the blocks fall, so a
+sound rendered in one call or chunk by chunk (streaming) is the same up to
+float32 rounding of the final mix.
+"""
+
+import numpy as np
+
+BLOCK_SIZE = 2048
+SAMPLE_RATE = 44100
+TWO_PI = 2 * np.pi
+
+
+def additive(phase, multipliers, amplitudes, out=None, block_size=BLOCK_SIZE,
+             frequency=None, sample_rate=SAMPLE_RATE) -> np.ndarray:
+    """
+    Sum of amplitudes[k] * sin(multipliers[k] * phase) over all partials k.
+
+    phase: fundamental phase in radians (float64, may be unwrapped).
+    frequency: fundamental frequency in Hz (scalar or one value per sample),
+    enables the Nyquist culling.
+    Returns (or writes into `out`) a float32 array shaped like phase.
+    """
+    phase = np.asarray(phase, dtype=np.float64)
+    multipliers = np.asarray(multipliers, dtype=np.float64)
+    amplitudes = np.asarray(amplitudes, dtype=np.float32)
+    if out is None:
+        out = np.empty(len(phase), dtype=np.float32)
+    if frequency is not None:
+        frequency = np.abs(np.broadcast_to(frequency, phase.shape))
+        limits = 0.5 * sample_rate / np.maximum(np.abs(multipliers), 1e-12)
+
+    for start in range(0, len(phase), block_size):
+        stop = start + block_size
+        mults, amps, crossing = multipliers, amplitudes, None
+        if frequency is not None:
+            f = frequency[start:stop]
+            keep = f.min() < limits                         # below Nyquist for some sample
+            mults, amps = multipliers[keep], amplitudes[keep]
+            crossing = f.max(initial=0.0) >= limits[keep]    # ... but not for all of them
+        if len(mults) == 0:
+            out[start:stop] = 0.0
+            continue
+
+        block = np.multiply.outer(phase[start:stop], mults)
+        # range reduction in float64: float32 cannot represent large phases precisely
+        block -= TWO_PI * np.round(block * (1 / TWO_PI))
+        block = block.astype(np.float32)
+        np.sin(block, out=block)
+        if crossing is not None and crossing.any():
+            block[:, crossing] *= f[:, None] < limits[keep][crossing]
+        np.dot(block, amps, out=out[start:stop])
+    return out
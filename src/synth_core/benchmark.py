@@ -0,0 +1,106 @@
+"""Benchmark of the additive kernel against the per-partial loop it replaces.
+
+Run from src/:
+    python -m synth_core.benchmark [--repeat N]
+
+Workloads mirror the project's generators: the emotional voice of
+creation_mouvement/sound (fundamental + 12 inharmonic partials, 3 s) and
+the harmonics_soft timbre of generation_son/synthesis/notes_to_wave.py.
+Nyquist culling and the oscillator bank (band-limited wavetable) are measured too; their
+"error" is the aliased energy they remove.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from synth_core import additive, oscillator_bank
+
+SAMPLE_RATE = 44100
+
+
+def loop_reference(phase, multipliers, amplitudes):
+    """Previous implementation: one full-length np.sin per partial, float64."""
+    wave = np.zeros_like(phase)
+    for mult, amp in zip(multipliers, amplitudes):
+        wave += amp * np.sin(mult * phase)
+    return wave
+
+
+def workloads(rng):
+    n = 3 * SAMPLE_RATE
+
+    # creation_mouvement voice, A = 1: phase multipliers k * k * (1 + inharm)
+    f = 440 * 2 ** rng.uniform(-0.5, 0.5, n)
+    phase = 2 * np.pi * np.cumsum(f) / SAMPLE_RATE
+    ks = np.arange(2, 14)
+    voice = (phase,
+             np.concatenate([[1.0], ks * ks * (1 + rng.uniform(-0.15, 0.15, len(ks)))]),
+             np.concatenate([[1.0], 1 / ks]))
+
+    # notes_to_wave harmonics_soft on a slide
+    pitch = np.linspace(40, 55, n)
+    freq = 440.0 * 2 ** (((pitch + 1) - 49) / 12)
+    soft = (np.cumsum(2 * np.pi * freq / SAMPLE_RATE),
+            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 16],
+            [1.0, 0.08, 0.04, 0.05, 0.02, 0.04, 0.02, 0.02, 0.02, 0.02, 0.04, 0.003])
+
+    return {"voice (13 partials, 3 s)": voice, "harmonics_soft (12 partials, 3 s)": soft}
+
+
+def wavetable_workload():
+    """harmonics_soft slide over two octaves, for the band-limited wavetable."""
+    n = 3 * SAMPLE_RATE
+    pitch = np.linspace(40, 64, n)
+    freq = 440.0 * 2 ** (((pitch + 1) - 49) / 12)
+    phase = np.cumsum(2 * np.pi * freq / SAMPLE_RATE)
+    spectrum = list(zip([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 16],
+                        [1.0, 0.08, 0.04, 0.05, 0.02, 0.04, 0.02, 0.02, 0.02, 0.02, 0.04, 0.003]))
+    return phase, freq, spectrum
+
+
+def timeit(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Additive synthesis kernel benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measure (best is kept)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{'workload':<36}{'loop (ms)':>12}{'kernel (ms)':>14}{'speedup':>10}{'max error':>12}")
+    for name, (phase, multipliers, amplitudes) in workloads(rng).items():
+        reference = loop_reference(phase, multipliers, amplitudes)
+        error = np.abs(additive(phase, multipliers, amplitudes) - reference).max()
+
+        t_loop = timeit(lambda: loop_reference(phase, multipliers, amplitudes), args.repeat)
+        t_kernel = timeit(lambda: additive(phase, multipliers, amplitudes), args.repeat)
+        print(f"{name:<36}{t_loop * 1e3:>12.2f}{t_kernel * 1e3:>14.2f}{t_loop / t_kernel:>9.1f}x{error:>12.2e}")
+
+        # Nyquist culling (the error column is the removed aliased energy, not a defect)
+        frequency = np.gradient(phase) * SAMPLE_RATE / (2 * np.pi)
+        culled = additive(phase, multipliers, amplitudes, frequency=frequency)
+        t_culled = timeit(lambda: additive(phase, multipliers, amplitudes, frequency=frequency), args.repeat)
+        print(f"{'  + Nyquist culling':<36}{'':>12}{t_culled * 1e3:>14.2f}{t_loop / t_culled:>9.1f}x"
+              f"{np.abs(culled - reference).max():>12.2e}")
+
+    phase, freq, spectrum = wavetable_workload()
+    multipliers, amplitudes = zip(*spectrum)
+    reference = loop_reference(phase, multipliers, amplitudes)
+    table = oscillator_bank(spectrum)
+    t_loop = timeit(lambda: loop_reference(phase, multipliers, amplitudes), args.repeat)
+    t_table = timeit(lambda: table.render(phase, freq), args.repeat)
+    error = np.abs(table.render(phase, freq) - reference).max()
+    print(f"{'oscillator bank, harmonics_soft':<36}{t_loop * 1e3:>12.2f}{t_table * 1e3:>14.2f}"
+          f"{t_loop / t_table:>9.1f}x{error:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Oscillator bank: the cheapest evaluation of a spectrum, partial group by group.
+
+Harmonic partials (integer multipliers) share one band-limited wavetable,
+so they cost a single interpolated lookup per sample whatever their number.
+Inharmonic partials (e.g. the whistle's 2.01 and 6.87, or the randomly
+detuned partials of the emotional voice) are not periodic in the
+fundamental phase and cannot live in one table; they go through the
+additive kernel, whose batched float32 np.sin is as fast as a per-partial
+table lookup in NumPy. Both paths skip partials above Nyquist.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .additive import BLOCK_SIZE, SAMPLE_RATE, additive
+from .wavetable import TABLE_SIZE, BandLimitedWavetable
+
+
+class OscillatorBank:
+    """Renders a spectrum [(multiplier, amplitude), ...] from a fundamental phase and frequency."""
+
+    def __init__(self, multipliers, amplitudes, sample_rate=SAMPLE_RATE, table_size=TABLE_SIZE):
+        multipliers = np.asarray(multipliers, dtype=np.float64)
+        amplitudes = np.asarray(amplitudes, dtype=np.float32)
+        self.sample_rate = sample_rate
+
+        harmonic = np.isclose(multipliers, np.round(multipliers)) & (multipliers != 0)
+        # a table only pays off when it replaces several sines
+        if harmonic.sum() < 2:
+            harmonic[:] = False
+
+        self.table = None
+        if harmonic.any():
+            self.table = BandLimitedWavetable(np.round(multipliers[harmonic]), amplitudes[harmonic],
+                                              size=table_size, sample_rate=sample_rate)
+        self.multipliers = multipliers[~harmonic]
+        self.amplitudes = amplitudes[~harmonic]
+
+    def render(self, phase, frequency, out=None, block_size=BLOCK_SIZE) -> np.ndarray:
+        """float32 output for a fundamental phase (radians) and frequency (Hz, scalar or per sample)."""
+        if self.table is not None:
+            out = self.table.render(phase, frequency, out=out, block_size=block_size)
+            if len(self.multipliers):
+                out += additive(phase, self.multipliers, self.amplitudes, block_size=block_size,
+                                frequency=frequency, sample_rate=self.sample_rate)
+            return out
+        return additive(phase, self.multipliers, self.amplitudes, out=out, block_size=block_size,
+                        frequency=frequency, sample_rate=self.sample_rate)
+
+
+@lru_cache(maxsize=32)
+def _cached(multipliers, amplitudes, sample_rate):
+    return OscillatorBank(multipliers, amplitudes, sample_rate)
+
+
+def oscillator_bank(spectrum, sample_rate=SAMPLE_RATE) -> OscillatorBank:
+    """Shared bank for a fixed spectrum (harmonics_soft, whistle partials, ...), built on first use."""
+    multipliers, amplitudes = zip(*spectrum)
+    return _cached(tuple(float(m) for m in multipliers), tuple(float(a) for a in amplitudes), sample_rate)
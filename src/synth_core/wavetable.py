@@ -0,0 +1,86 @@
+"""Band-limited wavetable oscillator for harmonic spectra.
+
+A spectrum with integer multipliers (harmonics_soft, harmonics_crisp, ...)
+is periodic in the fundamental phase, so one period can be precomputed and
+read back with linear interpolation: one table lookup per sample instead of
+one sine per partial.
+
+To stay band-limited, the table is mip-mapped by octave: level j is used
+for fundamentals up to min_frequency * 2**(j + 1) and contains only the
+harmonics below Nyquist at that frequency. The level is chosen per sample
+from its fundamental frequency (one table for the whole block when they all
+use the same level), so the output does not depend on where the blocks fall.
+"""
+
+import numpy as np
+
+from .additive import BLOCK_SIZE, SAMPLE_RATE, TWO_PI
+
+TABLE_SIZE = 4096
+
+
+class BandLimitedWavetable:
+    """Mip-mapped wavetable of a harmonic spectrum [(multiplier, amplitude), ...]."""
+
+    def __init__(self, multipliers, amplitudes, size=TABLE_SIZE,
+                 sample_rate=SAMPLE_RATE, min_frequency=20.0):
+        multipliers = np.asarray(multipliers, dtype=np.float64)
+        amplitudes = np.asarray(amplitudes, dtype=np.float64)
+        if not np.allclose(multipliers, np.round(multipliers)):
+            raise ValueError(f"Wavetables need integer multipliers (harmonic spectrum), got {multipliers}")
+
+        self.size = size
+        self.sample_rate = sample_rate
+        self.min_frequency = min_frequency
+
+        nyquist = 0.5 * sample_rate
+        n_levels = max(1, int(np.ceil(np.log2(nyquist / min_frequency))))
+        self.edges = min_frequency * 2.0 ** np.arange(1, n_levels + 1)    # top frequency of each level
+        grid = TWO_PI * np.arange(size + 1) / size     # guard point for interpolation
+
+        # level j: fundamentals up to min_frequency * 2**(j + 1)
+        self.tables = np.zeros((n_levels, size + 1), dtype=np.float32)
+        for j in range(n_levels):
+            top = min_frequency * 2 ** (j + 1)
+            for mult, amp in zip(multipliers, amplitudes):
+                if abs(mult) * top < nyquist:
+                    self.tables[j] += (amp * np.sin(mult * grid)).astype(np.float32)
+
+    def level(self, frequency: float) -> int:
+        """Mip level to use for a fundamental frequency (Hz)."""
+        j = int(np.ceil(np.log2(max(frequency, self.min_frequency) / self.min_frequency))) - 1
+        return min(max(j, 0), len(self.tables) - 1)
+
+    def levels(self, frequency) -> np.ndarray:
+        """Mip level of each sample, same rule as level()."""
+        return np.minimum(np.searchsorted(self.edges, frequency), len(self.tables) - 1)
+
+    def render(self, phase, frequency, out=None, block_size=BLOCK_SIZE) -> np.ndarray:
+        """
+        Oscillator output for a fundamental phase (radians, may be unwrapped)
+        and its frequency in Hz (scalar or one value per sample), as float32.
+        """
+        phase = np.asarray(phase, dtype=np.float64)
+        frequency = np.abs(np.broadcast_to(frequency, phase.shape))
+        if out is None:
+            out = np.empty(len(phase), dtype=np.float32)
+
+        for start in range(0, len(phase), block_size):
+            stop = start + block_size
+            f = frequency[start:stop]
+            low, high = self.level(f.min()), self.level(f.max())
+
+            position = (phase[start:stop] * (1 / TWO_PI)) % 1.0 * self.size
+            index = position.astype(np.int64)
+            np.minimum(index, self.size - 1, out=index)
+            frac = (position - index).astype(np.float32)
+
+            if low == high:
+                table = self.tables[low]
+                a, b = table[index], table[index + 1]
+            else:
+                rows = self.levels(f)
+                a, b = self.tables[rows, index], self.tables[rows, index + 1]
+            out[start:stop] = a + frac * (b - a)
+        return out
+